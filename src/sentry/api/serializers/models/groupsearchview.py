@@ -1,8 +1,9 @@
+from collections import defaultdict
 from collections.abc import MutableMapping
 from typing import Any, TypedDict
 
 from sentry.api.serializers import Serializer, register
-from sentry.models.groupsearchview import GroupSearchView
+from sentry.models.groupsearchview import GroupSearchView, GroupSearchViewProject
 from sentry.models.groupsearchviewlastvisited import GroupSearchViewLastVisited
 from sentry.models.groupsearchviewstarred import GroupSearchViewStarred
 from sentry.models.savedsearch import SORT_LITERALS
@@ -50,6 +51,12 @@ class GroupSearchViewSerializer(Serializer):
         )
         last_visited_map = {lv.group_search_view_id: lv for lv in last_visited_views}
 
+        projects_by_view: defaultdict[int, list[int]] = defaultdict(list)
+        for view_id, project_id in GroupSearchViewProject.objects.filter(
+            group_search_view_id__in=[item.id for item in item_list]
+        ).values_list("group_search_view_id", "project_id"):
+            projects_by_view[view_id].append(project_id)
+
         serialized_users = {
             user["id"]: user
             for user in user_service.serialize_many(
@@ -66,18 +73,18 @@ class GroupSearchViewSerializer(Serializer):
             attrs[item]["starred"] = item.id in user_starred_view_ids
             attrs[item]["stars"] = getattr(item, "popularity", 0)
             attrs[item]["created_by"] = serialized_users.get(str(item.user_id))
+            attrs[item]["projects"] = projects_by_view.get(item.id, [])
         return attrs
 
     def serialize(self, obj, attrs, user, **kwargs) -> GroupSearchViewSerializerResponse:
+        # `get_attrs` builds a fresh list per view, so it can be returned without copying.
+        projects: list[int] = attrs["projects"]
         if self.has_global_views is False:
-            projects = list(obj.projects.values_list("id", flat=True))
             num_projects = len(projects)
             if num_projects != 1:
                 projects = [projects[0] if num_projects > 1 else self.default_project]
-        else:
-            projects = (
-                [-1] if obj.is_all_projects else list(obj.projects.values_list("id", flat=True))
-            )
+        elif obj.is_all_projects:
+            projects = [-1]
 
         return {
             "id": str(obj.id),
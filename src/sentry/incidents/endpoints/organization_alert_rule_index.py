@@ -137,7 +137,7 @@ class AlertRuleIndexMixin(Endpoint):
             default_per_page=25,
         )
 
-        response[ALERT_RULES_COUNT_HEADER] = len(alert_rules)
+        response[ALERT_RULES_COUNT_HEADER] = alert_rules.count()
         response[MAX_QUERY_SUBSCRIPTIONS_HEADER] = settings.MAX_QUERY_SUBSCRIPTIONS_PER_ORG
         return response
 
@@ -16,8 +16,10 @@ class AlertRuleTriggerSerializer(Serializer):
         triggers = {item.id: item for item in item_list}
         result: DefaultDict[str, dict[str, list[str]]] = defaultdict(dict)
 
-        actions = AlertRuleTriggerAction.objects.filter(alert_rule_trigger__in=item_list).order_by(
-            "id"
+        actions = (
+            AlertRuleTriggerAction.objects.for_dispatch()
+            .filter(alert_rule_trigger__in=item_list)
+            .order_by("id")
         )
         serialized_actions = serialize(list(actions), **kwargs)
         for trigger, serialized in zip(actions, serialized_actions):
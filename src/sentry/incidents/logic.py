@@ -1301,10 +1301,10 @@ def create_alert_rule_trigger_action(
     :return: The created action
     """
     target_display: str | None = None
-    if type.value in AlertRuleTriggerAction.EXEMPT_SERVICES:
+    if type in AlertRuleTriggerAction.EXEMPT_SERVICES:
         raise InvalidTriggerActionError("Selected notification service is exempt from alert rules")
 
-    if type.value in AlertRuleTriggerAction.INTEGRATION_TYPES:
+    if type in AlertRuleTriggerAction.INTEGRATION_TYPES:
         if target_type != AlertRuleTriggerAction.TargetType.SPECIFIC:
             raise InvalidTriggerActionError("Must specify specific target type")
 
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
 import abc
+import itertools
 import logging
-from collections.abc import Callable, Collection, Iterable
+from collections.abc import Callable, Collection, Iterable, Mapping
 from enum import Enum, IntEnum, StrEnum
 from typing import TYPE_CHECKING, Any, ClassVar, Self
 
 from django.conf import settings
 from django.core.cache import cache
-from django.db import models
+from django.db import models, router
+from django.db.models import DEFERRED, F, Q
 from django.db.models.signals import post_delete, post_save, pre_delete
 from django.utils import timezone
 from django.utils.translation import gettext_lazy
@@ -40,6 +42,7 @@ from sentry.seer.anomaly_detection.delete_rule import delete_rule_in_seer
 from sentry.snuba.models import QuerySubscription
 from sentry.types.actor import Actor
 from sentry.utils import metrics
+from sentry.utils.iterators import chunked
 
 if TYPE_CHECKING:
     from sentry.incidents.action_handlers import ActionHandler
@@ -48,6 +51,27 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _to_cache_payload(instance: Model) -> dict[str, Any]:
+    """
+    Flattens a model instance into a dict of its concrete column values. This is much
+    cheaper to pickle than the instance itself, which drags along its `_state`.
+    """
+    return {
+        field.attname: getattr(instance, field.attname) for field in instance._meta.concrete_fields
+    }
+
+
+def _from_cache_payload[M: Model](model: type[M], payload: dict[str, Any]) -> M:
+    # Build the values by name, so that payloads cached before a column was added, removed or
+    # renamed can't shift values onto the wrong fields. Missing columns are left deferred.
+    fields = model._meta.concrete_fields
+    return model.from_db(
+        router.db_for_read(model),
+        [field.attname for field in fields],
+        [payload.get(field.attname, DEFERRED) for field in fields],
+    )
+
+
 class AlertRuleStatus(Enum):
     PENDING = 0
     SNAPSHOT = 4
@@ -55,6 +79,13 @@ class AlertRuleStatus(Enum):
     NOT_ENOUGH_DATA = 6
 
 
+# Every status except SNAPSHOT. `AlertRuleManager` filters on these positively rather than
+# excluding SNAPSHOT so that the partial index on `AlertRule` can be used.
+ACTIVE_ALERT_RULE_STATUSES = tuple(
+    status.value for status in AlertRuleStatus if status is not AlertRuleStatus.SNAPSHOT
+)
+
+
 class AlertRuleDetectionType(models.TextChoices):
     STATIC = "static", gettext_lazy("Static")
     PERCENT = "percent", gettext_lazy("Percent")
@@ -87,22 +118,31 @@ class AlertRuleManager(BaseManager["AlertRule"]):
     A manager that excludes all rows that are snapshots.
     """
 
-    CACHE_SUBSCRIPTION_KEY = "alert_rule:subscription:%s"
+    CACHE_SUBSCRIPTION_KEY = "alert_rule:subscription:v2:%s"
+    CACHE_INVALIDATION_BATCH_SIZE = 1000
 
     def get_queryset(self) -> BaseQuerySet[AlertRule]:
-        return super().get_queryset().exclude(status=AlertRuleStatus.SNAPSHOT.value)
+        return super().get_queryset().filter(status__in=ACTIVE_ALERT_RULE_STATUSES)
 
     def fetch_for_organization(
         self, organization: Organization, projects: Collection[Project] | None = None
     ):
         queryset = self.filter(organization=organization)
         if projects is not None:
-            queryset = queryset.filter(projects__in=projects).distinct()
+            # Filter through a subquery on the through table rather than joining the m2m,
+            # which would require a DISTINCT to dedupe rules spanning several projects.
+            queryset = queryset.filter(
+                id__in=AlertRuleProjects.objects.filter(project__in=projects).values(
+                    "alert_rule_id"
+                )
+            )
 
         return queryset
 
     def fetch_for_project(self, project: Project) -> BaseQuerySet[AlertRule]:
-        return self.filter(projects=project).distinct()
+        return self.filter(
+            id__in=AlertRuleProjects.objects.filter(project=project).values("alert_rule_id")
+        )
 
     @classmethod
     def __build_subscription_cache_key(cls, subscription_id: int) -> str:
@@ -113,32 +153,81 @@ class AlertRuleManager(BaseManager["AlertRule"]):
         Fetches the AlertRule associated with a Subscription. Attempts to fetch from
         cache then hits the database
         """
-        cache_key = self.__build_subscription_cache_key(subscription.id)
-        alert_rule = cache.get(cache_key)
+        alert_rule = self.get_for_subscriptions([subscription]).get(subscription.id)
         if alert_rule is None:
-            alert_rule = AlertRule.objects.get(snuba_query__subscriptions=subscription)
-            cache.set(cache_key, alert_rule, 3600)
-
+            raise AlertRule.DoesNotExist("AlertRule matching query does not exist.")
         return alert_rule
 
+    def get_for_subscriptions(self, subscriptions: Iterable[Model]) -> dict[int, AlertRule]:
+        """
+        Fetches the AlertRules associated with a batch of Subscriptions, keyed by
+        subscription id. Looks up all cache keys in a single round trip and then fetches
+        any misses from the database in one query. Subscriptions without an AlertRule are
+        omitted from the result.
+        """
+        cache_keys = {
+            subscription.id: self.__build_subscription_cache_key(subscription.id)
+            for subscription in subscriptions
+        }
+        if not cache_keys:
+            return {}
+
+        cached = cache.get_many(list(cache_keys.values()))
+        alert_rules: dict[int, AlertRule] = {}
+        missing_ids = []
+        for subscription_id, cache_key in cache_keys.items():
+            payload = cached.get(cache_key)
+            if payload is None:
+                missing_ids.append(subscription_id)
+            else:
+                alert_rules[subscription_id] = _from_cache_payload(AlertRule, payload)
+
+        if missing_ids:
+            fetched = {
+                alert_rule.query_subscription_id: alert_rule
+                for alert_rule in AlertRule.objects.filter(
+                    snuba_query__subscriptions__id__in=missing_ids
+                ).annotate(query_subscription_id=F("snuba_query__subscriptions__id"))
+            }
+            if fetched:
+                cache.set_many(
+                    {
+                        cache_keys[subscription_id]: _to_cache_payload(alert_rule)
+                        for subscription_id, alert_rule in fetched.items()
+                    },
+                    3600,
+                )
+            alert_rules.update(fetched)
+
+        return alert_rules
+
     @classmethod
     def clear_subscription_cache(cls, instance, **kwargs: Any) -> None:
         cache.delete(cls.__build_subscription_cache_key(instance.id))
-        assert cache.get(cls.__build_subscription_cache_key(instance.id)) is None
 
     @classmethod
-    def clear_alert_rule_subscription_caches(cls, instance: AlertRule, **kwargs: Any) -> None:
+    def clear_alert_rule_caches(cls, instance: AlertRule, **kwargs: Any) -> None:
+        """
+        Clears every cache entry derived from an AlertRule in a single pass: the entry for
+        each of its subscriptions along with its cached triggers.
+        """
+        # The cached payload holds every column of the rule, so this has to run on any
+        # save regardless of `update_fields`. `delete_many` is authoritative, so we don't
+        # read the keys back afterwards.
         subscription_ids = QuerySubscription.objects.filter(
             snuba_query_id=instance.snuba_query_id
         ).values_list("id", flat=True)
-        if subscription_ids:
-            cache.delete_many(
-                cls.__build_subscription_cache_key(sub_id) for sub_id in subscription_ids
-            )
-            assert all(
-                cache.get(cls.__build_subscription_cache_key(sub_id)) is None
-                for sub_id in subscription_ids
-            )
+        cache_keys = itertools.chain(
+            (AlertRuleTriggerManager._build_trigger_cache_key(instance.id),),
+            (
+                cls.__build_subscription_cache_key(sub_id)
+                for sub_id in subscription_ids.iterator(
+                    chunk_size=cls.CACHE_INVALIDATION_BATCH_SIZE
+                )
+            ),
+        )
+        for batch in chunked(cache_keys, cls.CACHE_INVALIDATION_BATCH_SIZE):
+            cache.delete_many(batch)
 
     @classmethod
     def delete_data_in_seer(cls, instance: AlertRule, **kwargs: Any) -> None:
@@ -249,6 +338,13 @@ class AlertRule(Model):
         db_table = "sentry_alertrule"
         base_manager_name = "objects_with_snapshots"
         default_manager_name = "objects_with_snapshots"
+        indexes = [
+            models.Index(
+                fields=["organization", "status"],
+                name="alertrule_org_active_status",
+                condition=Q(status__in=ACTIVE_ALERT_RULE_STATUSES),
+            ),
+        ]
 
     __repr__ = sane_repr("id", "name", "date_added")
 
@@ -283,7 +379,7 @@ class AlertRule(Model):
 
 
 class AlertRuleTriggerManager(BaseManager["AlertRuleTrigger"]):
-    CACHE_KEY = "alert_rule_triggers:alert_rule:%s"
+    CACHE_KEY = "alert_rule_triggers:alert_rule:v2:%s"
 
     @classmethod
     def _build_trigger_cache_key(cls, alert_rule_id: int) -> str:
@@ -294,22 +390,57 @@ class AlertRuleTriggerManager(BaseManager["AlertRuleTrigger"]):
         Fetches the AlertRuleTriggers associated with an AlertRule. Attempts to fetch
         from cache then hits the database
         """
-        cache_key = self._build_trigger_cache_key(alert_rule.id)
-        triggers = cache.get(cache_key)
-        if triggers is None:
-            triggers = list(AlertRuleTrigger.objects.filter(alert_rule=alert_rule))
-            cache.set(cache_key, triggers, 3600)
+        return self.get_for_alert_rules([alert_rule])[alert_rule.id]
+
+    def get_for_alert_rules(
+        self, alert_rules: Iterable[AlertRule]
+    ) -> dict[int, list[AlertRuleTrigger]]:
+        """
+        Fetches the AlertRuleTriggers associated with a batch of AlertRules, keyed by
+        alert rule id. Looks up all cache keys in a single round trip and then fetches
+        any misses from the database in one query.
+        """
+        cache_keys = {
+            alert_rule.id: self._build_trigger_cache_key(alert_rule.id)
+            for alert_rule in alert_rules
+        }
+        if not cache_keys:
+            return {}
+
+        cached = cache.get_many(list(cache_keys.values()))
+        triggers: dict[int, list[AlertRuleTrigger]] = {}
+        missing_ids = []
+        for alert_rule_id, cache_key in cache_keys.items():
+            payloads = cached.get(cache_key)
+            if payloads is None:
+                missing_ids.append(alert_rule_id)
+            else:
+                triggers[alert_rule_id] = [
+                    _from_cache_payload(AlertRuleTrigger, payload) for payload in payloads
+                ]
+
+        if missing_ids:
+            fetched: dict[int, list[AlertRuleTrigger]] = {
+                alert_rule_id: [] for alert_rule_id in missing_ids
+            }
+            for trigger in AlertRuleTrigger.objects.filter(alert_rule_id__in=missing_ids):
+                fetched[trigger.alert_rule_id].append(trigger)
+            cache.set_many(
+                {
+                    cache_keys[alert_rule_id]: [
+                        _to_cache_payload(trigger) for trigger in rule_triggers
+                    ]
+                    for alert_rule_id, rule_triggers in fetched.items()
+                },
+                3600,
+            )
+            triggers.update(fetched)
+
         return triggers
 
     @classmethod
     def clear_trigger_cache(cls, instance: AlertRuleTrigger, **kwargs: Any) -> None:
         cache.delete(cls._build_trigger_cache_key(instance.alert_rule_id))
-        assert cache.get(cls._build_trigger_cache_key(instance.alert_rule_id)) is None
-
-    @classmethod
-    def clear_alert_rule_trigger_cache(cls, instance: AlertRuleTrigger, **kwargs: Any) -> None:
-        cache.delete(cls._build_trigger_cache_key(instance.id))
-        assert cache.get(cls._build_trigger_cache_key(instance.id)) is None
 
 
 class AlertRuleThresholdType(Enum):
@@ -318,6 +449,16 @@ class AlertRuleThresholdType(Enum):
     ABOVE_AND_BELOW = 2
 
 
+# Precomputed value -> member lookup, for hot paths that would otherwise coerce raw column
+# values through `EnumMeta.__call__`.
+ALERT_RULE_THRESHOLD_TYPE_BY_VALUE: Mapping[int, AlertRuleThresholdType] = {
+    threshold_type.value: threshold_type for threshold_type in AlertRuleThresholdType
+}
+ALERT_RULE_DETECTION_TYPE_BY_VALUE: Mapping[str, AlertRuleDetectionType] = {
+    detection_type.value: detection_type for detection_type in AlertRuleDetectionType
+}
+
+
 @region_silo_model
 class AlertRuleTrigger(Model):
     """
@@ -347,6 +488,13 @@ class AlertRuleTrigger(Model):
         unique_together = (("alert_rule", "label"),)
 
 
+# Precomputed value -> lowercased name lookup for `ActionService`, used to build metric keys
+# on the trigger action dispatch path.
+ACTION_SERVICE_NAMES: Mapping[int, str] = {
+    service.value: service.name.lower() for service in ActionService
+}
+
+
 class AlertRuleTriggerActionMethod(StrEnum):
     FIRE = "fire"
     RESOLVE = "resolve"
@@ -360,6 +508,13 @@ class AlertRuleTriggerActionManager(BaseManager["AlertRuleTriggerAction"]):
     def get_queryset(self) -> BaseQuerySet[AlertRuleTriggerAction]:
         return super().get_queryset().exclude(status=ObjectStatus.PENDING_DELETION)
 
+    def for_dispatch(self) -> BaseQuerySet[AlertRuleTriggerAction]:
+        """
+        Returns actions with their trigger and alert rule joined in, so that resolving
+        `AlertRuleTriggerAction.target` doesn't need extra queries per action.
+        """
+        return self.select_related("alert_rule_trigger__alert_rule")
+
 
 class ActionHandlerFactory(abc.ABC):
     """A factory for action handlers tied to a specific incident service.
@@ -409,17 +564,30 @@ class _AlertRuleActionHandlerClassFactory(ActionHandlerFactory):
 
 class _FactoryRegistry:
     def __init__(self) -> None:
-        # Two kinds of index. The value sets should be equal at all times.
-        self.by_action_service: dict[ActionService, ActionHandlerFactory] = {}
-        self.by_slug: dict[str, ActionHandlerFactory] = {}
+        self.factories: list[ActionHandlerFactory] = []
+        # Two kinds of index into `factories`, keyed by service type and slug.
+        self.by_action_service: dict[int, int] = {}
+        self.by_slug: dict[str, int] = {}
 
     def register(self, factory: ActionHandlerFactory) -> None:
         if factory.service_type in self.by_action_service:
             raise Exception(f"Handler already registered for type {factory.service_type}")
         if factory.slug in self.by_slug:
             raise Exception(f"Handler already registered with slug={factory.slug!r}")
-        self.by_action_service[factory.service_type] = factory
-        self.by_slug[factory.slug] = factory
+        index = len(self.factories)
+        self.factories.append(factory)
+        self.by_action_service[factory.service_type] = index
+        self.by_slug[factory.slug] = index
+
+    def get_by_action_service(
+        self, service_type: ActionService | int
+    ) -> ActionHandlerFactory | None:
+        index = self.by_action_service.get(service_type)
+        return None if index is None else self.factories[index]
+
+    def get_by_slug(self, slug: str) -> ActionHandlerFactory | None:
+        index = self.by_slug.get(slug)
+        return None if index is None else self.factories[index]
 
 
 @region_silo_model
@@ -440,6 +608,8 @@ class AlertRuleTriggerAction(AbstractNotificationAction):
     # access to this otherwise private class variable
     _factory_registrations = _FactoryRegistry()
 
+    # These hold raw ints. Since `ActionService` is an IntEnum, both raw column values
+    # and enum members can be tested for membership directly without converting.
     INTEGRATION_TYPES = frozenset(
         (
             Type.PAGERDUTY.value,
@@ -499,8 +669,10 @@ class AlertRuleTriggerAction(AbstractNotificationAction):
         return None
 
     @staticmethod
-    def build_handler(type: ActionService) -> ActionHandler | None:
-        factory = AlertRuleTriggerAction._factory_registrations.by_action_service.get(type)
+    def build_handler(type: ActionService | int) -> ActionHandler | None:
+        # `ActionService` is an IntEnum, so raw integer column values hash and compare
+        # equal to their members and can be used to look up the factory directly.
+        factory = AlertRuleTriggerAction._factory_registrations.get_by_action_service(type)
         if factory is not None:
             return factory.build_handler()
         else:
@@ -516,7 +688,7 @@ class AlertRuleTriggerAction(AbstractNotificationAction):
         new_status: IncidentStatus,
         notification_uuid: str | None = None,
     ) -> None:
-        handler = AlertRuleTriggerAction.build_handler(AlertRuleTriggerAction.Type(self.type))
+        handler = AlertRuleTriggerAction.build_handler(self.type)
         if handler:
             return handler.fire(
                 action=action,
@@ -536,7 +708,7 @@ class AlertRuleTriggerAction(AbstractNotificationAction):
         new_status: IncidentStatus,
         notification_uuid: str | None = None,
     ) -> None:
-        handler = AlertRuleTriggerAction.build_handler(AlertRuleTriggerAction.Type(self.type))
+        handler = AlertRuleTriggerAction.build_handler(self.type)
         if handler:
             return handler.resolve(
                 action=action,
@@ -589,16 +761,19 @@ class AlertRuleTriggerAction(AbstractNotificationAction):
         return inner
 
     @classmethod
-    def get_registered_factory(cls, service_type: ActionService) -> ActionHandlerFactory:
-        return cls._factory_registrations.by_action_service[service_type]
+    def get_registered_factory(cls, service_type: ActionService | int) -> ActionHandlerFactory:
+        factory = cls._factory_registrations.get_by_action_service(service_type)
+        if factory is None:
+            raise KeyError(service_type)
+        return factory
 
     @classmethod
     def get_registered_factories(cls) -> list[ActionHandlerFactory]:
-        return list(cls._factory_registrations.by_action_service.values())
+        return list(cls._factory_registrations.factories)
 
     @classmethod
     def look_up_factory_by_slug(cls, slug: str) -> ActionHandlerFactory | None:
-        return cls._factory_registrations.by_slug.get(slug)
+        return cls._factory_registrations.get_by_slug(slug)
 
     @classmethod
     def get_all_slugs(cls) -> list[str]:
@@ -642,10 +817,8 @@ pre_delete.connect(AlertRuleManager.dual_delete_alert_rule, sender=AlertRule)
 post_delete.connect(AlertRuleManager.clear_subscription_cache, sender=QuerySubscription)
 post_delete.connect(AlertRuleManager.delete_data_in_seer, sender=AlertRule)
 post_save.connect(AlertRuleManager.clear_subscription_cache, sender=QuerySubscription)
-post_save.connect(AlertRuleManager.clear_alert_rule_subscription_caches, sender=AlertRule)
-post_delete.connect(AlertRuleManager.clear_alert_rule_subscription_caches, sender=AlertRule)
+post_save.connect(AlertRuleManager.clear_alert_rule_caches, sender=AlertRule)
+post_delete.connect(AlertRuleManager.clear_alert_rule_caches, sender=AlertRule)
 
-post_delete.connect(AlertRuleTriggerManager.clear_alert_rule_trigger_cache, sender=AlertRule)
-post_save.connect(AlertRuleTriggerManager.clear_alert_rule_trigger_cache, sender=AlertRule)
 post_save.connect(AlertRuleTriggerManager.clear_trigger_cache, sender=AlertRuleTrigger)
 post_delete.connect(AlertRuleTriggerManager.clear_trigger_cache, sender=AlertRuleTrigger)
@@ -22,6 +22,7 @@ from sentry.incidents.logic import (
     update_incident_status,
 )
 from sentry.incidents.models.alert_rule import (
+    ALERT_RULE_THRESHOLD_TYPE_BY_VALUE,
     AlertRule,
     AlertRuleDetectionType,
     AlertRuleStatus,
@@ -541,7 +542,7 @@ class SubscriptionProcessor:
                 else:
                     # OVER/UNDER value trigger
                     alert_operator, resolve_operator = self.THRESHOLD_TYPE_OPERATORS[
-                        AlertRuleThresholdType(self.alert_rule.threshold_type)
+                        ALERT_RULE_THRESHOLD_TYPE_BY_VALUE[self.alert_rule.threshold_type]
                     ]
                     if alert_operator(
                         aggregation_value, trigger.alert_threshold
@@ -6,6 +6,7 @@ from typing import Any
 from django.db import router, transaction
 
 from sentry.incidents.models.alert_rule import (
+    ACTION_SERVICE_NAMES,
     AlertRuleStatus,
     AlertRuleTriggerAction,
     AlertRuleTriggerActionMethod,
@@ -97,15 +98,15 @@ def handle_trigger_action(
     **kwargs: Any,
 ) -> None:
     try:
-        action = AlertRuleTriggerAction.objects.select_related(
-            "alert_rule_trigger", "alert_rule_trigger__alert_rule"
-        ).get(id=action_id)
+        action = AlertRuleTriggerAction.objects.for_dispatch().get(id=action_id)
     except AlertRuleTriggerAction.DoesNotExist:
         metrics.incr("incidents.alert_rules.action.skipping_missing_action")
         return
 
     try:
-        incident = Incident.objects.select_related("organization").get(id=incident_id)
+        incident = Incident.objects.select_related(
+            "organization", "alert_rule__snuba_query", "subscription"
+        ).get(id=incident_id)
     except Incident.DoesNotExist:
         metrics.incr("incidents.alert_rules.action.skipping_missing_incident")
         return
@@ -124,9 +125,7 @@ def handle_trigger_action(
         metrics.incr("incidents.alert_rules.action.incident_activity_missing")
 
     metrics.incr(
-        "incidents.alert_rules.action.{}.{}".format(
-            AlertRuleTriggerAction.Type(action.type).name.lower(), method
-        )
+        "incidents.alert_rules.action.{}.{}".format(ACTION_SERVICE_NAMES[action.type], method)
     )
 
     getattr(action, method)(
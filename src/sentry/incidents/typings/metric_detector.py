@@ -6,6 +6,8 @@ from typing import Any
 
 from sentry.eventstore.models import GroupEvent
 from sentry.incidents.models.alert_rule import (
+    ALERT_RULE_DETECTION_TYPE_BY_VALUE,
+    ALERT_RULE_THRESHOLD_TYPE_BY_VALUE,
     AlertRule,
     AlertRuleDetectionType,
     AlertRuleThresholdType,
@@ -15,13 +17,13 @@ from sentry.incidents.models.incident import Incident, IncidentStatus
 from sentry.issues.issue_occurrence import IssueOccurrence
 from sentry.models.group import Group, GroupStatus
 from sentry.models.groupopenperiod import GroupOpenPeriod
-from sentry.notifications.models.notificationaction import ActionTarget
+from sentry.notifications.models.notificationaction import ACTION_TARGET_BY_VALUE, ActionTarget
 from sentry.snuba.models import QuerySubscription, SnubaQuery
 from sentry.types.group import PriorityLevel
 from sentry.workflow_engine.models import Action, Detector
 
 
-@dataclass
+@dataclass(slots=True)
 class AlertContext:
     name: str
     action_identifier_id: int
@@ -39,8 +41,8 @@ class AlertContext:
         return cls(
             name=alert_rule.name,
             action_identifier_id=alert_rule.id,
-            threshold_type=AlertRuleThresholdType(alert_rule.threshold_type),
-            detection_type=AlertRuleDetectionType(alert_rule.detection_type),
+            threshold_type=ALERT_RULE_THRESHOLD_TYPE_BY_VALUE[alert_rule.threshold_type],
+            detection_type=ALERT_RULE_DETECTION_TYPE_BY_VALUE[alert_rule.detection_type],
             comparison_delta=alert_rule.comparison_delta,
             sensitivity=alert_rule.sensitivity,
             alert_threshold=alert_rule_threshold,
@@ -70,7 +72,7 @@ class AlertContext:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class NotificationContext:
     """
     NotificationContext is a dataclass that represents the context required send a notification.
@@ -93,7 +95,7 @@ class NotificationContext:
             target_display=action.target_display,
             sentry_app_config=action.sentry_app_config,
             sentry_app_id=str(action.sentry_app_id) if action.sentry_app_id else None,
-            target_type=ActionTarget(action.target_type),
+            target_type=ACTION_TARGET_BY_VALUE[action.target_type],
         )
 
     @classmethod
@@ -122,7 +124,7 @@ class NotificationContext:
                 integration_id=None,
                 target_identifier=action.config.get("target_identifier"),
                 target_display=None,
-                target_type=ActionTarget(action.config.get("target_type")),
+                target_type=ACTION_TARGET_BY_VALUE[action.config["target_type"]],
             )
         return cls(
             id=action.id,
@@ -132,7 +134,7 @@ class NotificationContext:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricIssueContext:
     id: int
     open_period_identifier: int  # Used for link building
@@ -201,6 +203,11 @@ class MetricIssueContext:
         new_status: IncidentStatus,
         metric_value: float | None = None,
     ) -> MetricIssueContext:
+        """
+        Reads `incident.alert_rule.snuba_query` and `incident.subscription`. Callers should
+        fetch the incident with `select_related("alert_rule__snuba_query", "subscription")`
+        to avoid lazy-loading each of them.
+        """
         return cls(
             id=incident.id,
             open_period_identifier=incident.identifier,
@@ -213,7 +220,7 @@ class MetricIssueContext:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class OpenPeriodContext:
     """
     We want to eventually delete this class. it serves as a way to pass data around
@@ -2,3 +2,8 @@ from __future__ import annotations
 
 ME = "ME"
 MSTEAMS_URL_FORMAT = "[{text}]({url})"
+
+
+def format_msteams_url(text: str, url: str | None) -> str:
+    """Equivalent to `MSTEAMS_URL_FORMAT.format(text=text, url=url)`."""
+    return f"[{text}]({url})"
@@ -8,7 +8,7 @@ from sentry.integrations.messaging.message_builder import (
     build_attachment_title,
     get_title_link,
 )
-from sentry.integrations.msteams.card_builder import MSTEAMS_URL_FORMAT
+from sentry.integrations.msteams.card_builder import format_msteams_url
 from sentry.integrations.msteams.card_builder.base import MSTeamsMessageBuilder
 from sentry.integrations.msteams.card_builder.block import OpenUrlAction
 from sentry.integrations.types import ExternalProviders
@@ -35,6 +35,8 @@ from .block import (
 
 
 class MSTeamsNotificationsMessageBuilder(MSTeamsMessageBuilder):
+    provider = ExternalProviders.MSTEAMS
+
     def __init__(
         self, notification: BaseNotification, context: Mapping[str, Any], recipient: Actor
     ):
@@ -43,9 +45,7 @@ class MSTeamsNotificationsMessageBuilder(MSTeamsMessageBuilder):
         self.recipient = recipient
 
     def create_footer_block(self) -> ColumnSetBlock | None:
-        footer_text = self.notification.build_notification_footer(
-            self.recipient, ExternalProviders.MSTEAMS
-        )
+        footer_text = self.notification.build_notification_footer(self.recipient, self.provider)
 
         if footer_text:
             footer = create_footer_text_block(footer_text)
@@ -59,11 +59,11 @@ class MSTeamsNotificationsMessageBuilder(MSTeamsMessageBuilder):
 
     def create_attachment_title_block(self) -> TextBlock | None:
         title = self.notification.build_attachment_title(self.recipient)
-        title_link = self.notification.get_title_link(self.recipient, ExternalProviders.MSTEAMS)
+        title_link = self.notification.get_title_link(self.recipient, self.provider)
 
         return (
             create_text_block(
-                MSTEAMS_URL_FORMAT.format(text=title, url=title_link),
+                format_msteams_url(title, title_link),
                 size=TextSize.LARGE,
                 weight=TextWeight.BOLDER,
             )
@@ -73,21 +73,16 @@ class MSTeamsNotificationsMessageBuilder(MSTeamsMessageBuilder):
 
     def create_title_block(self) -> TextBlock:
         return create_text_block(
-            self.notification.get_notification_title(ExternalProviders.MSTEAMS, self.context),
+            self.notification.get_notification_title(self.provider, self.context),
             size=TextSize.LARGE,
         )
 
     def create_description_block(self) -> TextBlock | None:
         message_description = self.notification.get_message_description(
-            self.recipient, ExternalProviders.MSTEAMS
+            self.recipient, self.provider
         )
         return (
-            create_text_block(
-                self.notification.get_message_description(
-                    self.recipient, ExternalProviders.MSTEAMS
-                ),
-                size=TextSize.MEDIUM,
-            )
+            create_text_block(message_description, size=TextSize.MEDIUM)
             if message_description
             else None
         )
@@ -115,7 +110,7 @@ class MSTeamsNotificationsMessageBuilder(MSTeamsMessageBuilder):
             fields=fields,
             footer=self.create_footer_block(),
             actions=self.create_action_blocks(
-                self.notification.get_message_actions(self.recipient, ExternalProviders.MSTEAMS)
+                self.notification.get_message_actions(self.recipient, self.provider)
             ),
         )
 
@@ -133,13 +128,11 @@ class MSTeamsIssueNotificationsMessageBuilder(MSTeamsNotificationsMessageBuilder
 
     def create_attachment_title_block(self) -> TextBlock | None:
         title = build_attachment_title(self.group)
-        title_link = get_title_link(
-            self.group, None, False, True, self.notification, ExternalProviders.MSTEAMS
-        )
+        title_link = get_title_link(self.group, None, False, True, self.notification, self.provider)
 
         return (
             create_text_block(
-                MSTEAMS_URL_FORMAT.format(text=title, url=title_link),
+                format_msteams_url(title, title_link),
                 size=TextSize.LARGE,
                 weight=TextWeight.BOLDER,
             )
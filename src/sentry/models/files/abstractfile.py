@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import abc
+import bisect
 import io
 import logging
 import mmap
 import os
+import shutil
 import tempfile
 from collections.abc import Sequence
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, wait
 from hashlib import sha1
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
@@ -28,11 +30,41 @@ from sentry.utils.rollback_metrics import incr_rollback_metrics
 
 logger = logging.getLogger(__name__)
 
+# Size of the reads issued against blob storage when streaming file contents.
+READ_CHUNK_SIZE = 1 << 20
+
+# Shared across files so prefetching and assembling don't spin up (and tear
+# down) a set of threads per file.
+_blob_fetch_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="blob-fetch")
+
+
+class _MmapWriter:
+    """Minimal writable file object over a region of an mmap starting at
+    `offset`, so blob contents can be copied with `shutil.copyfileobj`.
+    """
+
+    def __init__(self, mem: mmap.mmap, offset: int) -> None:
+        self._mem = mem
+        self._offset = offset
+
+    def write(self, b: bytes) -> int:
+        end = self._offset + len(b)
+        self._mem[self._offset : end] = b
+        self._offset = end
+        return len(b)
+
+
+def _fetch_into(mem: mmap.mmap, offset: int, getfile) -> None:
+    with getfile() as sf:
+        shutil.copyfileobj(sf, _MmapWriter(mem, offset), READ_CHUNK_SIZE)
+
 
 class ChunkedFileBlobIndexWrapper:
     def __init__(self, indexes, mode=None, prefetch=False, prefetch_to=None, delete=True):
         # eager load from database incase its a queryset
         self._indexes = list(indexes)
+        self._offsets = [i.offset for i in self._indexes]
+        self._size = sum(i.blob.size for i in self._indexes)
         self._curfile = None
         self._curidx = None
         if prefetch:
@@ -75,7 +107,7 @@ class ChunkedFileBlobIndexWrapper:
 
     @property
     def size(self):
-        return sum(i.blob.size for i in self._indexes)
+        return self._size
 
     def open(self) -> None:
         self.closed = False
@@ -95,18 +127,12 @@ class ChunkedFileBlobIndexWrapper:
 
         mem = mmap.mmap(f.fileno(), size)
 
-        def fetch_file(offset, getfile) -> None:
-            with getfile() as sf:
-                while True:
-                    chunk = sf.read(65535)
-                    if not chunk:
-                        break
-                    mem[offset : offset + len(chunk)] = chunk
-                    offset += len(chunk)
-
-        with ThreadPoolExecutor(max_workers=4) as exe:
-            for idx in self._indexes:
-                exe.submit(fetch_file, idx.offset, idx.blob.getfile)
+        wait(
+            [
+                _blob_fetch_pool.submit(_fetch_into, mem, idx.offset, idx.blob.getfile)
+                for idx in self._indexes
+            ]
+        )
 
         mem.flush()
         self._curfile = f
@@ -132,14 +158,12 @@ class ChunkedFileBlobIndexWrapper:
             # Empty file, there's no seeking to be done.
             return
 
-        for n, idx in enumerate(self._indexes[::-1]):
-            if idx.offset <= pos:
-                if idx != self._curidx:
-                    self._idxiter = iter(self._indexes[-(n + 1) :])
-                    self._nextidx()
-                break
-        else:
+        n = bisect.bisect_right(self._offsets, pos) - 1
+        if n < 0:
             raise ValueError("Cannot seek to pos")
+        if self._indexes[n] != self._curidx:
+            self._idxiter = iter(self._indexes[n:])
+            self._nextidx()
         assert self._curfile is not None
         assert self._curidx is not None
         self._curfile.seek(pos - self._curidx.offset)
@@ -174,28 +198,28 @@ class ChunkedFileBlobIndexWrapper:
             assert self._curfile is not None
             return self._curfile.read(n)
 
-        result = bytearray()
+        result = io.BytesIO()
 
         # Read to the end of the file
         if n < 0:
             while self._curfile is not None:
-                blob_result = self._curfile.read(32768)
+                blob_result = self._curfile.read(READ_CHUNK_SIZE)
                 if not blob_result:
                     self._nextidx()
                 else:
-                    result.extend(blob_result)
+                    result.write(blob_result)
 
         # Read until a certain number of bytes are read
         else:
             while n > 0 and self._curfile is not None:
-                blob_result = self._curfile.read(min(n, 32768))
+                blob_result = self._curfile.read(min(n, READ_CHUNK_SIZE))
                 if not blob_result:
                     self._nextidx()
                 else:
                     n -= len(blob_result)
-                    result.extend(blob_result)
+                    result.write(blob_result)
 
-        return bytes(result)
+        return result.getvalue()
 
 
 BlobIndexType = TypeVar("BlobIndexType", bound=AbstractFileBlobIndex)
@@ -233,13 +257,15 @@ class AbstractFile(Model, _Parent[BlobIndexType, BlobType]):
     def _blob_index_records(self) -> Sequence[BlobIndexType]: ...
 
     @abc.abstractmethod
-    def _create_blob_index(self, blob: BlobType, offset: int) -> BlobIndexType: ...
+    def _create_blob_indexes(
+        self, blob_offsets: Sequence[tuple[int, BlobType]]
+    ) -> list[BlobIndexType]: ...
 
     @abc.abstractmethod
     def _create_blob_from_file(self, contents: ContentFile, logger: Any) -> BlobType: ...
 
     @abc.abstractmethod
-    def _get_blobs_by_id(self, blob_ids: Sequence[int]) -> models.QuerySet[BlobType]: ...
+    def _get_blobs_by_id(self, blob_ids: Sequence[int]) -> dict[int, BlobType]: ...
 
     @abc.abstractmethod
     def _delete_unreferenced_blob_task(self) -> SentryTask: ...
@@ -307,9 +333,9 @@ class AbstractFile(Model, _Parent[BlobIndexType, BlobType]):
 
         >>> indexes = file.putfile(fileobj)
         """
-        results = []
+        blob_offsets = []
         offset = 0
-        checksum = sha1(b"")
+        checksum = sha1(usedforsecurity=False)
 
         while True:
             contents = fileobj.read(blob_size)
@@ -319,8 +345,9 @@ class AbstractFile(Model, _Parent[BlobIndexType, BlobType]):
 
             blob_fileobj = ContentFile(contents)
             blob = self._create_blob_from_file(blob_fileobj, logger=logger)
-            results.append(self._create_blob_index(blob=blob, offset=offset))
+            blob_offsets.append((offset, blob))
             offset += blob.size
+        results = self._create_blob_indexes(blob_offsets)
         self.size = offset
         self.checksum = checksum.hexdigest()
         metrics.distribution("filestore.file-size", offset, unit="byte")
@@ -340,10 +367,9 @@ class AbstractFile(Model, _Parent[BlobIndexType, BlobType]):
         # bypass generics
         with transaction.atomic(using=router.db_for_write(type(self))):
             try:
-                file_blobs_qs = self._get_blobs_by_id(blob_ids=file_blob_ids)
+                blobs_by_id = self._get_blobs_by_id(blob_ids=file_blob_ids)
 
                 # Ensure blobs are in the order and duplication as provided
-                blobs_by_id = {blob.id: blob for blob in file_blobs_qs}
                 file_blobs = [blobs_by_id[blob_id] for blob_id in file_blob_ids]
             except Exception:
                 # Most likely a `KeyError` like `SENTRY-11QP` because an `id` in
@@ -351,24 +377,42 @@ class AbstractFile(Model, _Parent[BlobIndexType, BlobType]):
                 logger.exception("`FileBlob` disappeared during `assemble_file`")
                 raise
 
-            new_checksum = sha1(b"")
+            new_checksum = sha1(usedforsecurity=False)
             offset = 0
+            blob_offsets = []
             for blob in file_blobs:
-                try:
-                    self._create_blob_index(blob=blob, offset=offset)
-                except IntegrityError:
-                    incr_rollback_metrics(name="file_assemble_from_file_blob_ids")
-                    # Most likely a `ForeignKeyViolation` like `SENTRY-11P5`, because
-                    # the blob we want to link does not exist anymore
-                    logger.exception("`FileBlob` disappeared trying to link `FileBlobIndex`")
-                    raise
-
-                with blob.getfile() as blobfile:
-                    for chunk in blobfile.chunks():
-                        new_checksum.update(chunk)
-                        tf.write(chunk)
+                blob_offsets.append((offset, blob))
                 offset += blob.size
 
+            try:
+                self._create_blob_indexes(blob_offsets)
+            except IntegrityError:
+                incr_rollback_metrics(name="file_assemble_from_file_blob_ids")
+                # Most likely a `ForeignKeyViolation` like `SENTRY-11P5`, because
+                # the blob we want to link does not exist anymore
+                logger.exception("`FileBlob` disappeared trying to link `FileBlobIndex`")
+                raise
+
+            if offset:
+                # Size the tempfile up front so blobs can be fetched in
+                # parallel straight to their offsets, the same way `_prefetch`
+                # does, then hash the assembled contents in one pass.
+                tf.seek(offset - 1)
+                tf.write(b"\x00")
+                tf.flush()
+
+                with mmap.mmap(tf.fileno(), offset) as mem:
+                    futures = [
+                        _blob_fetch_pool.submit(_fetch_into, mem, blob_offset, blob.getfile)
+                        for blob_offset, blob in blob_offsets
+                    ]
+                    wait(futures)
+                    for future in futures:
+                        future.result()
+
+                    new_checksum.update(mem)
+                    mem.flush()
+
             self.size = offset
             self.checksum = new_checksum.hexdigest()
 
@@ -385,7 +429,7 @@ class AbstractFile(Model, _Parent[BlobIndexType, BlobType]):
 
     @sentry_sdk.tracing.trace
     def delete(self, *args, **kwargs):
-        blob_ids = [blob.id for blob in self.blobs.all()]
+        blob_ids = list(self.blobs.values_list("id", flat=True))
         ret = super().delete(*args, **kwargs)
 
         # Wait to delete blobs. This helps prevent
@@ -31,14 +31,22 @@ class ControlFile(AbstractFile[ControlFileBlobIndex, ControlFileBlob]):
             key=lambda fbi: fbi.offset,
         )
 
-    def _create_blob_index(self, blob: ControlFileBlob, offset: int) -> ControlFileBlobIndex:
-        return ControlFileBlobIndex.objects.create(file=self, blob=blob, offset=offset)
+    def _create_blob_indexes(
+        self, blob_offsets: Sequence[tuple[int, ControlFileBlob]]
+    ) -> list[ControlFileBlobIndex]:
+        return ControlFileBlobIndex.objects.bulk_create(
+            [
+                ControlFileBlobIndex(file=self, blob=blob, offset=offset)
+                for offset, blob in blob_offsets
+            ],
+            batch_size=500,
+        )
 
     def _create_blob_from_file(self, contents: ContentFile, logger: Any) -> ControlFileBlob:
         return ControlFileBlob.from_file(contents, logger)
 
-    def _get_blobs_by_id(self, blob_ids: Sequence[int]) -> models.QuerySet[ControlFileBlob]:
-        return ControlFileBlob.objects.filter(id__in=blob_ids).all()
+    def _get_blobs_by_id(self, blob_ids: Sequence[int]) -> dict[int, ControlFileBlob]:
+        return ControlFileBlob.objects.in_bulk(blob_ids)
 
     def _delete_unreferenced_blob_task(self) -> SentryTask:
         return delete_unreferenced_blobs_control
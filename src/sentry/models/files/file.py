@@ -34,14 +34,19 @@ class File(AbstractFile[FileBlobIndex, FileBlob]):
             key=lambda fbi: fbi.offset,
         )
 
-    def _create_blob_index(self, blob: FileBlob, offset: int) -> FileBlobIndex:
-        return FileBlobIndex.objects.create(file=self, blob=blob, offset=offset)
+    def _create_blob_indexes(
+        self, blob_offsets: Sequence[tuple[int, FileBlob]]
+    ) -> list[FileBlobIndex]:
+        return FileBlobIndex.objects.bulk_create(
+            [FileBlobIndex(file=self, blob=blob, offset=offset) for offset, blob in blob_offsets],
+            batch_size=500,
+        )
 
     def _create_blob_from_file(self, contents: ContentFile, logger: Any) -> FileBlob:
         return FileBlob.from_file(contents, logger)
 
-    def _get_blobs_by_id(self, blob_ids: Sequence[int]) -> models.QuerySet[FileBlob]:
-        return FileBlob.objects.filter(id__in=blob_ids).all()
+    def _get_blobs_by_id(self, blob_ids: Sequence[int]) -> dict[int, FileBlob]:
+        return FileBlob.objects.in_bulk(blob_ids)
 
     def _delete_unreferenced_blob_task(self) -> SentryTask:
         return delete_unreferenced_blobs_region
@@ -554,8 +554,10 @@ class Project(Model):
                 monitor.update(organization_id=organization.id)
 
         # Remove alert owners not in new org
-        alert_rules = AlertRule.objects.fetch_for_project(self).filter(
-            Q(user_id__isnull=False) | Q(team_id__isnull=False)
+        alert_rules = (
+            AlertRule.objects.fetch_for_project(self)
+            .filter(Q(user_id__isnull=False) | Q(team_id__isnull=False))
+            .only("id", "user_id", "team_id", "snuba_query_id")
         )
         for alert_rule in alert_rules:
             is_member = False
@@ -100,6 +100,11 @@ class ActionTarget(FlexibleIntEnum):
         )
 
 
+ACTION_TARGET_BY_VALUE: Mapping[int, ActionTarget] = {
+    target.value: target for target in ActionTarget
+}
+
+
 class ActionTrigger(FlexibleIntEnum):
     """
     The possible sources of action notifications.
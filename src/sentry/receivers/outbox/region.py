@@ -116,5 +116,5 @@ def process_relocation_reply_with_export(payload: Any, **kwds):
             org_slug=slug,
             # TODO(azaslavsky): finish transfer from `encrypted_contents` -> `encrypted_bytes`.
             encrypted_contents=None,
-            encrypted_bytes=[int(byte) for byte in encrypted_bytes.read()],
+            encrypted_bytes=list(encrypted_bytes.read()),
         )
@@ -4,11 +4,10 @@
 # defined, because we want to reflect on type annotations and avoid forward references.
 
 import logging
-from datetime import UTC, datetime
-from io import BytesIO
+import time
+from io import SEEK_CUR, SEEK_END, SEEK_SET, RawIOBase
 
 from django.db import router
-from django.db.utils import IntegrityError
 from django.utils import timezone
 from sentry_sdk import capture_exception
 
@@ -28,11 +27,51 @@ from sentry.relocation.tasks.process import fulfill_cross_region_export_request,
 from sentry.relocation.tasks.transfer import process_relocation_transfer_control
 from sentry.relocation.utils import RELOCATION_BLOB_SIZE, RELOCATION_FILE_TYPE
 from sentry.utils.db import atomic_transaction
-from sentry.utils.rollback_metrics import incr_rollback_metrics
 
 logger = logging.getLogger("sentry.relocation")
 
 
+class _EncryptedBytesReader(RawIOBase):
+    """
+    A seekable, read-only file over the `list[int]` wire encoding of `encrypted_bytes`. Only the
+    slice requested by each read is converted to `bytes`, so consumers that read in blob-sized
+    chunks never hold a second, fully materialized copy of the payload.
+    """
+
+    def __init__(self, data: list[int]) -> None:
+        self._data = data
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = SEEK_SET) -> int:
+        if whence == SEEK_SET:
+            pos = offset
+        elif whence == SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == SEEK_END:
+            pos = len(self._data) + offset
+        else:
+            raise ValueError(f"Invalid value for whence: {whence}")
+        if pos < 0:
+            raise ValueError(f"Negative seek position {pos}")
+        self._pos = pos
+        return pos
+
+    def readinto(self, buffer) -> int:
+        chunk = bytes(self._data[self._pos : self._pos + len(buffer)])
+        buffer[: len(chunk)] = chunk
+        self._pos += len(chunk)
+        return len(chunk)
+
+
 class DBBackedRelocationExportService(RegionRelocationExportService):
     def request_new_export(
         self,
@@ -66,7 +105,7 @@ class DBBackedRelocationExportService(RegionRelocationExportService):
                 replying_region_name,
                 org_slug,
                 encrypt_with_public_key,
-                int(round(datetime.now(tz=UTC).timestamp())),
+                round(time.time()),
             ]
         )
         logger.info("SaaS -> SaaS exporting task scheduled", extra=logger_data)
@@ -83,55 +122,48 @@ class DBBackedRelocationExportService(RegionRelocationExportService):
         encrypted_bytes: list[int] | None = None,
     ) -> None:
 
-        with atomic_transaction(
-            using=(
-                router.db_for_write(Relocation),
-                router.db_for_write(RelocationFile),
-                router.db_for_write(File),
-            )
-        ):
-            logger_data = {
-                "uuid": relocation_uuid,
-                "requesting_region_name": requesting_region_name,
-                "replying_region_name": replying_region_name,
-                "org_slug": org_slug,
-                # TODO(azaslavsky): finish transfer from `encrypted_contents` -> `encrypted_bytes`.
-                "encrypted_bytes_size": len(encrypted_bytes or []),
-            }
-            logger.info("SaaS -> SaaS reply received in triggering region", extra=logger_data)
-
-            try:
-                relocation: Relocation = Relocation.objects.get(uuid=relocation_uuid)
-            except Relocation.DoesNotExist as e:
-                logger.exception("Could not locate Relocation model by UUID: %s", relocation_uuid)
-                capture_exception(e)
-                return
-
+        logger_data = {
+            "uuid": relocation_uuid,
+            "requesting_region_name": requesting_region_name,
+            "replying_region_name": replying_region_name,
+            "org_slug": org_slug,
             # TODO(azaslavsky): finish transfer from `encrypted_contents` -> `encrypted_bytes`.
-            fp = BytesIO(bytes(encrypted_bytes or []))
-            file = File.objects.create(name="raw-relocation-data.tar", type=RELOCATION_FILE_TYPE)
-            file.putfile(fp, blob_size=RELOCATION_BLOB_SIZE, logger=logger)
-            logger.info("SaaS -> SaaS relocation underlying File created", extra=logger_data)
+            "encrypted_bytes_size": len(encrypted_bytes or []),
+        }
+        logger.info("SaaS -> SaaS reply received in triggering region", extra=logger_data)
+
+        try:
+            relocation: Relocation = Relocation.objects.get(uuid=relocation_uuid)
+        except Relocation.DoesNotExist as e:
+            logger.exception("Could not locate Relocation model by UUID: %s", relocation_uuid)
+            capture_exception(e)
+            return
 
+        # Uploading the blobs can take a long time for large exports, so do it before opening a
+        # transaction rather than holding one open for the duration of the upload.
+        # TODO(azaslavsky): finish transfer from `encrypted_contents` -> `encrypted_bytes`.
+        fp = _EncryptedBytesReader(encrypted_bytes or [])
+        file = File.objects.create(name="raw-relocation-data.tar", type=RELOCATION_FILE_TYPE)
+        file.putfile(fp, blob_size=RELOCATION_BLOB_SIZE, logger=logger)
+        logger.info("SaaS -> SaaS relocation underlying File created", extra=logger_data)
+
+        with atomic_transaction(using=router.db_for_write(RelocationFile)):
             # This write ensures that the entire chain triggered by `uploading_start` remains
             # idempotent, since only one (relocation_uuid, relocation_file_kind) pairing can exist
-            # in that database's table at a time. If we try to write a second, it will fail due to
-            # that unique constraint.
-            try:
-                RelocationFile.objects.create(
-                    relocation=relocation,
-                    file=file,
-                    kind=RelocationFile.Kind.RAW_USER_DATA.value,
-                )
-            except IntegrityError:
-                incr_rollback_metrics(RelocationFile)
-                # We already have the file, we can proceed.
-                pass
+            # in that database's table at a time. A retried reply finds the existing pairing
+            # instead, and the file we just uploaded is dropped so that it isn't orphaned.
+            _, created = RelocationFile.objects.get_or_create(
+                relocation=relocation,
+                kind=RelocationFile.Kind.RAW_USER_DATA.value,
+                defaults={"file": file},
+            )
+            if not created:
+                file.delete()
 
-            logger.info("SaaS -> SaaS relocation RelocationFile saved", extra=logger_data)
+        logger.info("SaaS -> SaaS relocation RelocationFile saved", extra=logger_data)
 
-            uploading_complete.apply_async(args=[relocation.uuid])
-            logger.info("SaaS -> SaaS relocation next task scheduled", extra=logger_data)
+        uploading_complete.apply_async(args=[relocation.uuid])
+        logger.info("SaaS -> SaaS relocation next task scheduled", extra=logger_data)
 
 
 class ProxyingRelocationExportService(ControlRelocationExportService):
@@ -191,7 +223,7 @@ class ProxyingRelocationExportService(ControlRelocationExportService):
         path = f"runs/{relocation_uuid}/saas_to_saas_export/{org_slug}.tar"
         relocation_storage = get_relocation_storage()
         # TODO(azaslavsky): finish transfer from `encrypted_contents` -> `encrypted_bytes`.
-        fp = BytesIO(bytes(encrypted_bytes or []))
+        fp = _EncryptedBytesReader(encrypted_bytes or [])
         relocation_storage.save(path, fp)
         logger.info("SaaS -> SaaS export contents retrieved", extra=logger_data)
 
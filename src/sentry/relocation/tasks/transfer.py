@@ -163,7 +163,7 @@ def process_relocation_transfer_control(transfer_id: int) -> None:
                     org_slug=slug,
                     # TODO(mark): finish transfer from `encrypted_contents` -> `encrypted_bytes`.
                     encrypted_contents=None,
-                    encrypted_bytes=[int(byte) for byte in encrypted_bytes.read()],
+                    encrypted_bytes=list(encrypted_bytes.read()),
                 )
                 # We are done with this stage of the transfer
                 transfer.delete()
@@ -226,7 +226,7 @@ def process_relocation_transfer_region(transfer_id: int) -> None:
                 org_slug=slug,
                 # TODO(mark): finish transfer from `encrypted_contents` -> `encrypted_bytes`.
                 encrypted_contents=None,
-                encrypted_bytes=[int(byte) for byte in encrypted_bytes.read()],
+                encrypted_bytes=list(encrypted_bytes.read()),
             )
         # Remove the transfer once the reply is sent.
         transfer.delete()
@@ -0,0 +1,13 @@
+-- Increment a counter, setting its TTL only when the key is first created.
+assert(#KEYS == 1, "provide exactly one counter key")
+assert(#ARGV == 1, "provide a TTL")
+
+local key = KEYS[1]
+local ttl = ARGV[1]
+
+local value = redis.call("INCR", key)
+if value == 1 then
+    redis.call("EXPIRE", key, ttl)
+end
+
+return value
@@ -3,6 +3,8 @@ from __future__ import annotations
 from collections.abc import Iterable
 from typing import Any
 
+from django.db.models import Q
+
 from sentry import features
 from sentry.integrations.models.integration import Integration
 from sentry.integrations.services.integration import RpcIntegration
@@ -40,29 +42,35 @@ def update_code_owners_schema(
     )
     from sentry.models.projectcodeowners import ProjectCodeOwners
 
+    integration_id = _unpack_integration_id(integration)
+    if not projects and integration_id is None:
+        return
+
     organization = load_model_from_db(Organization, organization)
 
     if not features.has("organizations:integrations-codeowners", organization):
         return
     try:
-        code_owners: Iterable[ProjectCodeOwners] = []
+        code_owners_filter = Q()
 
         if projects:
-            projects = [load_model_from_db(Project, project) for project in projects]
-            code_owners = ProjectCodeOwners.objects.filter(project__in=projects)
+            project_ids = [
+                project.id if isinstance(project, Project) else project for project in projects
+            ]
+            code_owners_filter |= Q(project_id__in=project_ids)
 
-        integration_id = _unpack_integration_id(integration)
         if integration_id is not None:
             code_mapping_ids = RepositoryProjectPathConfig.objects.filter(
                 organization_id=organization.id,
                 integration_id=integration_id,
             ).values_list("id", flat=True)
+            code_owners_filter |= Q(repository_project_path_config__in=code_mapping_ids)
 
-            code_owners = ProjectCodeOwners.objects.filter(
-                repository_project_path_config__in=code_mapping_ids
-            )
+        code_owners = ProjectCodeOwners.objects.filter(code_owners_filter)
 
-        for code_owner in code_owners:
+        # `update_schema` reads both relations on every row, so join them up front rather than
+        # lazily loading each one per code owner.
+        for code_owner in code_owners.select_related("project", "repository_project_path_config"):
             code_owner.update_schema(organization=organization)
 
     # TODO(nisanthan): May need to add logging  for the cases where we might want to have more information if something fails
@@ -71,6 +79,7 @@ def update_code_owners_schema(
 
 
 def _unpack_integration_id(integration: Integration | RpcIntegration | int | None) -> int | None:
-    if isinstance(integration, (Integration, RpcIntegration)):
-        return integration.id
-    return integration
+    # Callers almost always pass the id, so check for that first.
+    if integration is None or isinstance(integration, int):
+        return integration
+    return integration.id
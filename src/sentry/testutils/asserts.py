@@ -1,5 +1,3 @@
-from functools import reduce
-
 from django.http import StreamingHttpResponse
 
 from sentry.constants import ObjectStatus
@@ -21,8 +19,8 @@ def assert_mock_called_once_with_partial(mock, *args, **kwargs):
     m_args, m_kwargs = mock.call_args
     for i, arg in enumerate(args):
         assert m_args[i] == arg
-    for kwarg in kwargs:
-        assert m_kwargs[kwarg] == kwargs[kwarg], (m_kwargs[kwarg], kwargs[kwarg])
+    for kwarg, value in kwargs.items():
+        assert m_kwargs[kwarg] == value, (m_kwargs[kwarg], value)
 
 
 def assert_commit_shape(commit):
@@ -82,10 +80,12 @@ Helper functions to assert integration SLO metrics
 """
 
 
+def _calls_with_outcome(mock_record, outcome):
+    return [call for call in mock_record.mock_calls if call.args[0] == outcome]
+
+
 def assert_halt_metric(mock_record, error_msg):
-    (event_halts,) = (
-        call for call in mock_record.mock_calls if call.args[0] == EventLifecycleOutcome.HALTED
-    )
+    (event_halts,) = _calls_with_outcome(mock_record, EventLifecycleOutcome.HALTED)
     if isinstance(error_msg, Exception):
         assert isinstance(event_halts.args[1], type(error_msg))
     else:
@@ -93,9 +93,7 @@ def assert_halt_metric(mock_record, error_msg):
 
 
 def assert_failure_metric(mock_record, error_msg):
-    (event_failures,) = (
-        call for call in mock_record.mock_calls if call.args[0] == EventLifecycleOutcome.FAILURE
-    )
+    (event_failures,) = _calls_with_outcome(mock_record, EventLifecycleOutcome.FAILURE)
     if isinstance(error_msg, Exception):
         assert isinstance(event_failures.args[1], type(error_msg))
     else:
@@ -135,19 +133,12 @@ def assert_middleware_metrics(middleware_calls):
 
 
 def assert_count_of_metric(mock_record, outcome, outcome_count):
-    calls = reduce(
-        lambda acc, calls: (acc + 1 if calls.args[0] == outcome else acc),
-        mock_record.mock_calls,
-        0,
-    )
-    assert calls == outcome_count
+    assert len(_calls_with_outcome(mock_record, outcome)) == outcome_count
 
 
 # Given messages_or_errors need to align 1:1 to the calls :bufo-big-eyes:
 def assert_many_halt_metrics(mock_record, messages_or_errors):
-    halts = (
-        call for call in mock_record.mock_calls if call.args[0] == EventLifecycleOutcome.HALTED
-    )
+    halts = _calls_with_outcome(mock_record, EventLifecycleOutcome.HALTED)
     for halt, error_msg in zip(halts, messages_or_errors):
         if isinstance(error_msg, Exception):
             assert isinstance(halt.args[1], type(error_msg))
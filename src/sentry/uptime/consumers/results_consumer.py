@@ -2,12 +2,19 @@ from __future__ import annotations
 
 import logging
 import random
+import time
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from threading import Lock
 from uuid import UUID
 
 from arroyo import Topic as ArroyoTopic
 from arroyo.backends.kafka import KafkaPayload, KafkaProducer, build_kafka_configuration
+from cachetools import TTLCache, cached
+from cachetools.func import ttl_cache
+from django.db import router
 from django.utils import timezone as django_timezone
+from redis.client import Pipeline
 from sentry_kafka_schemas.codecs import Codec
 from sentry_kafka_schemas.schema_types.snuba_uptime_results_v1 import SnubaUptimeResult
 from sentry_kafka_schemas.schema_types.uptime_results_v1 import (
@@ -20,6 +27,7 @@ from sentry_kafka_schemas.schema_types.uptime_results_v1 import (
 from sentry import features, options, quotas
 from sentry.conf.types.kafka_definition import Topic, get_topic_codec
 from sentry.constants import ObjectStatus
+from sentry.models.organization import Organization
 from sentry.remote_subscriptions.consumers.result_consumer import (
     ResultProcessor,
     ResultsStrategyFactory,
@@ -50,10 +58,14 @@ from sentry.uptime.subscriptions.tasks import (
 from sentry.uptime.types import IncidentStatus, ProjectUptimeSubscriptionMode
 from sentry.utils import metrics
 from sentry.utils.arroyo_producer import SingletonProducer
+from sentry.utils.db import atomic_transaction
 from sentry.utils.kafka_config import get_kafka_producer_cluster_options, get_topic_definition
+from sentry.utils.redis import load_redis_script
 
 logger = logging.getLogger(__name__)
 
+incr_with_ttl = load_redis_script("uptime/incr_with_ttl.lua")
+
 LAST_UPDATE_REDIS_TTL = timedelta(days=7)
 ONBOARDING_MONITOR_PERIOD = timedelta(days=3)
 # When onboarding a new subscription how many total failures are allowed to happen during
@@ -71,9 +83,15 @@ AUTO_DETECTED_ACTIVE_SUBSCRIPTION_INTERVAL = timedelta(minutes=1)
 ACTIVE_THRESHOLD_REDIS_TTL = timedelta(seconds=max(UptimeSubscription.IntervalSeconds)) + timedelta(
     minutes=60
 )
+# Redis takes TTLs in seconds; convert once rather than on every command
+_LAST_UPDATE_REDIS_TTL_SECONDS = int(LAST_UPDATE_REDIS_TTL.total_seconds())
+_ONBOARDING_FAILURE_REDIS_TTL_SECONDS = int(ONBOARDING_FAILURE_REDIS_TTL.total_seconds())
+_ACTIVE_THRESHOLD_REDIS_TTL_SECONDS = int(ACTIVE_THRESHOLD_REDIS_TTL.total_seconds())
 SNUBA_UPTIME_RESULTS_CODEC: Codec[SnubaUptimeResult] = get_topic_codec(Topic.SNUBA_UPTIME_RESULTS)
 # We want to limit cardinality for provider tags. This controls how many tags we should include
 TOTAL_PROVIDERS_TO_INCLUDE_AS_TAGS = 30
+# Metric tag values for each subscription mode
+MODE_TAG_BY_VALUE = {mode.value: mode.name.lower() for mode in ProjectUptimeSubscriptionMode}
 
 
 def _get_snuba_uptime_checks_producer() -> KafkaProducer:
@@ -81,6 +99,10 @@ def _get_snuba_uptime_checks_producer() -> KafkaProducer:
     producer_config = get_kafka_producer_cluster_options(cluster_name)
     producer_config.pop("compression.type", None)
     producer_config.pop("message.max.bytes", None)
+    # Results arrive one at a time, so give librdkafka a short window to group them into larger
+    # produce requests rather than sending a request per result.
+    producer_config.setdefault("linger.ms", 20)
+    producer_config.setdefault("batch.num.messages", 10000)
     return KafkaProducer(build_kafka_configuration(default_config=producer_config))
 
 
@@ -111,14 +133,28 @@ def get_active_recovery_threshold():
     return options.get("uptime.active-recovery-threshold")
 
 
+@ttl_cache(ttl=60)
+def memoized_top_hosting_provider_names(limit: int) -> frozenset[str]:
+    """
+    Memoized version of get_top_hosting_provider_names. The ranking changes slowly, so there's
+    no need to run the aggregate query for every result we process.
+    """
+    return frozenset(get_top_hosting_provider_names(limit))
+
+
 def get_host_provider_if_valid(subscription: UptimeSubscription) -> str:
-    if subscription.host_provider_name in get_top_hosting_provider_names(
+    if subscription.host_provider_name in memoized_top_hosting_provider_names(
         TOTAL_PROVIDERS_TO_INCLUDE_AS_TAGS
     ):
         return subscription.host_provider_name
     return "other"
 
 
+@lru_cache(maxsize=65536)
+def _subscription_id_int(subscription_id: str) -> int:
+    return UUID(subscription_id).int
+
+
 def should_run_region_checks(subscription: UptimeSubscription, result: CheckResult) -> bool:
     if not subscription.subscription_id:
         # Edge case where we can have no subscription_id here
@@ -132,10 +168,9 @@ def should_run_region_checks(subscription: UptimeSubscription, result: CheckResu
 
     # Run region checks and updates once an hour
     runs_per_hour = UptimeSubscription.IntervalSeconds.ONE_HOUR / subscription.interval_seconds
-    subscription_run = UUID(subscription.subscription_id).int % runs_per_hour
-    current_run = (
-        datetime.fromtimestamp(result["scheduled_check_time_ms"] / 1000, timezone.utc).minute * 60
-    ) // subscription.interval_seconds
+    subscription_run = _subscription_id_int(subscription.subscription_id) % runs_per_hour
+    current_minute = (result["scheduled_check_time_ms"] // 60_000) % 60
+    current_run = (current_minute * 60) // subscription.interval_seconds
     if subscription_run == current_run:
         return True
 
@@ -146,12 +181,18 @@ def has_reached_status_threshold(
     project_subscription: ProjectUptimeSubscription,
     status: str,
     metric_tags: dict[str, str],
+    pipeline: Pipeline,
 ) -> bool:
-    pipeline = _get_cluster().pipeline()
+    """
+    Increments the consecutive count for `status` and checks it against the active thresholds.
+    Any commands already queued on `pipeline` are flushed in the same round-trip.
+    """
     key = build_active_consecutive_status_key(project_subscription, status)
+    # Note where the INCR reply will land, since other commands may already be queued
+    incr_index = len(pipeline)
     pipeline.incr(key)
-    pipeline.expire(key, ACTIVE_THRESHOLD_REDIS_TTL)
-    status_count = int(pipeline.execute()[0])
+    pipeline.expire(key, _ACTIVE_THRESHOLD_REDIS_TTL_SECONDS)
+    status_count = int(pipeline.execute()[incr_index])
     result = (status == CHECKSTATUS_FAILURE and status_count >= get_active_failure_threshold()) or (
         status == CHECKSTATUS_SUCCESS and status_count >= get_active_recovery_threshold()
     )
@@ -164,6 +205,26 @@ def has_reached_status_threshold(
     return result
 
 
+def update_uptime_status(
+    project_subscription: ProjectUptimeSubscription, uptime_status: UptimeStatus
+) -> None:
+    uptime_status_update_date = django_timezone.now()
+    # TODO(epurkhiser): Dual until we're only reading the uptime_status
+    # from the uptime_subscription.
+    with atomic_transaction(
+        using=(
+            router.db_for_write(ProjectUptimeSubscription),
+            router.db_for_write(UptimeSubscription),
+        )
+    ):
+        project_subscription.update(
+            uptime_status=uptime_status, uptime_status_update_date=uptime_status_update_date
+        )
+        project_subscription.uptime_subscription.update(
+            uptime_status=uptime_status, uptime_status_update_date=uptime_status_update_date
+        )
+
+
 def try_check_and_update_regions(
     subscription: UptimeSubscription,
     result: CheckResult,
@@ -187,6 +248,19 @@ def try_check_and_update_regions(
     update_remote_uptime_subscription.delay(subscription.id)
 
 
+@cached(
+    TTLCache(maxsize=4096, ttl=300),
+    key=lambda organization: organization.id,
+    lock=Lock(),
+)
+def memoized_event_retention(organization: Organization) -> int | None:
+    """
+    Memoized version of the quota backend's event retention lookup, keyed on the organization id.
+    Retention only changes with plan changes, so there's no need to look it up for every result.
+    """
+    return quotas.backend.get_event_retention(organization=organization)
+
+
 def produce_snuba_uptime_result(
     project_subscription: ProjectUptimeSubscription,
     result: CheckResult,
@@ -201,7 +275,7 @@ def produce_snuba_uptime_result(
     """
     try:
         project = project_subscription.project
-        retention_days = quotas.backend.get_event_retention(organization=project.organization) or 90
+        retention_days = memoized_event_retention(project.organization) or 90
 
         if project_subscription.uptime_status == UptimeStatus.FAILED:
             incident_status = IncidentStatus.IN_INCIDENT
@@ -257,12 +331,12 @@ class UptimeResultProcessor(ResultProcessor[CheckResult, UptimeSubscription]):
     def is_shadow_region_result(
         self, result: CheckResult, regions: list[UptimeSubscriptionRegion]
     ) -> bool:
-        shadow_region_slugs = {
-            region.region_slug
+        result_region = result["region"]
+        return any(
+            region.region_slug == result_region
+            and region.mode == UptimeSubscriptionRegion.RegionMode.SHADOW
             for region in regions
-            if region.mode == UptimeSubscriptionRegion.RegionMode.SHADOW
-        }
-        return result["region"] in shadow_region_slugs
+        )
 
     def handle_result(self, subscription: UptimeSubscription | None, result: CheckResult):
         if random.random() < 0.01:
@@ -302,12 +376,14 @@ class UptimeResultProcessor(ResultProcessor[CheckResult, UptimeSubscription]):
             return
 
         cluster = _get_cluster()
-        last_update_raw: str | None = cluster.get(build_last_update_key(project_subscription))
+        last_update_key = build_last_update_key(project_subscription)
+        last_update_raw: str | None = cluster.get(last_update_key)
         last_update_ms = 0 if last_update_raw is None else int(last_update_raw)
 
-        if features.has(
+        detailed_logging = features.has(
             "organizations:uptime-detailed-logging", project_subscription.project.organization
-        ):
+        )
+        if detailed_logging:
             logger.info("handle_result_for_project.before_dedupe", extra=result)
 
         # Nothing to do if this subscription is disabled. Should mean there are
@@ -320,7 +396,8 @@ class UptimeResultProcessor(ResultProcessor[CheckResult, UptimeSubscription]):
             metrics.incr("uptime.result_processor.dropped_no_feature")
             return
 
-        mode_name = ProjectUptimeSubscriptionMode(project_subscription.mode).name.lower()
+        mode_name = MODE_TAG_BY_VALUE[project_subscription.mode]
+        mode_tags = {"mode": mode_name, **metric_tags}
 
         status_reason = "none"
         if result["status_reason"]:
@@ -328,9 +405,11 @@ class UptimeResultProcessor(ResultProcessor[CheckResult, UptimeSubscription]):
 
         metrics.incr(
             "uptime.result_processor.handle_result_for_project",
-            tags={"mode": mode_name, "status_reason": status_reason, **metric_tags},
+            tags={"status_reason": status_reason, **mode_tags},
             sample_rate=1.0,
         )
+        # Writes made while processing this result are queued here and sent in a single round-trip
+        pipeline = cluster.pipeline()
         try:
             if result["scheduled_check_time_ms"] <= last_update_ms:
                 # If the scheduled check time is older than the most recent update then we've already processed it.
@@ -339,14 +418,12 @@ class UptimeResultProcessor(ResultProcessor[CheckResult, UptimeSubscription]):
                 # We only ever want to process the first value related to each check, so we just skip and log here
                 metrics.incr(
                     "uptime.result_processor.skipping_already_processed_update",
-                    tags={"mode": mode_name, **metric_tags},
+                    tags=mode_tags,
                     sample_rate=1.0,
                 )
                 return
 
-            if features.has(
-                "organizations:uptime-detailed-logging", project_subscription.project.organization
-            ):
+            if detailed_logging:
                 logger.info("handle_result_for_project.after_dedupe", extra=result)
 
             if result["status"] == CHECKSTATUS_MISSED_WINDOW:
@@ -369,46 +446,46 @@ class UptimeResultProcessor(ResultProcessor[CheckResult, UptimeSubscription]):
                         result["duration_ms"],
                         sample_rate=1.0,
                         unit="millisecond",
-                        tags={"mode": mode_name, **metric_tags},
+                        tags=mode_tags,
                     )
                 metrics.distribution(
                     "uptime.result_processor.check_result.delay",
                     result["actual_check_time_ms"] - result["scheduled_check_time_ms"],
                     sample_rate=1.0,
                     unit="millisecond",
-                    tags={"mode": mode_name, **metric_tags},
+                    tags=mode_tags,
                 )
 
             if project_subscription.mode == ProjectUptimeSubscriptionMode.AUTO_DETECTED_ONBOARDING:
                 self.handle_result_for_project_auto_onboarding_mode(
-                    project_subscription, result, metric_tags.copy()
+                    project_subscription, result, metric_tags
                 )
             elif project_subscription.mode in (
                 ProjectUptimeSubscriptionMode.AUTO_DETECTED_ACTIVE,
                 ProjectUptimeSubscriptionMode.MANUAL,
             ):
                 self.handle_result_for_project_active_mode(
-                    project_subscription, result, metric_tags.copy()
+                    project_subscription, result, metric_tags, pipeline
                 )
         except Exception:
             logger.exception("Failed to process result for uptime project subscription")
 
         # Now that we've processed the result for this project subscription we track the last update date
-        cluster = _get_cluster()
-        cluster.set(
-            build_last_update_key(project_subscription),
+        pipeline.set(
+            last_update_key,
             int(result["scheduled_check_time_ms"]),
-            ex=LAST_UPDATE_REDIS_TTL,
+            ex=_LAST_UPDATE_REDIS_TTL_SECONDS,
         )
+        pipeline.execute()
 
         # After processing the result and updating Redis, produce message to Kafka
         if options.get("uptime.snuba_uptime_results.enabled"):
-            produce_snuba_uptime_result(project_subscription, result, metric_tags.copy())
+            produce_snuba_uptime_result(project_subscription, result, metric_tags)
 
         # The amount of time it took for a check result to get from the checker to this consumer and be processed
         metrics.distribution(
             "uptime.result_processor.check_completion_time",
-            (datetime.now().timestamp() * 1000)
+            (time.time() * 1000)
             - (
                 result["actual_check_time_ms"] + result["duration_ms"]
                 if result["duration_ms"]
@@ -428,10 +505,8 @@ class UptimeResultProcessor(ResultProcessor[CheckResult, UptimeSubscription]):
         if result["status"] == CHECKSTATUS_FAILURE:
             redis = _get_cluster()
             key = build_onboarding_failure_key(project_subscription)
-            pipeline = redis.pipeline()
-            pipeline.incr(key)
-            pipeline.expire(key, ONBOARDING_FAILURE_REDIS_TTL)
-            failure_count = pipeline.execute()[0]
+            # The TTL is only set on the first failure so that the count covers the onboarding period
+            failure_count = incr_with_ttl([key], [_ONBOARDING_FAILURE_REDIS_TTL_SECONDS], redis)
             if failure_count >= ONBOARDING_FAILURE_THRESHOLD:
                 # If we've hit too many failures during the onboarding period we stop monitoring
                 if detector := get_detector(project_subscription.uptime_subscription):
@@ -489,19 +564,21 @@ class UptimeResultProcessor(ResultProcessor[CheckResult, UptimeSubscription]):
         project_subscription: ProjectUptimeSubscription,
         result: CheckResult,
         metric_tags: dict[str, str],
+        pipeline: Pipeline,
     ):
         uptime_status = project_subscription.uptime_status
         result_status = result["status"]
 
-        redis = _get_cluster()
         delete_status = (
             CHECKSTATUS_FAILURE if result_status == CHECKSTATUS_SUCCESS else CHECKSTATUS_SUCCESS
         )
         # Delete any consecutive results we have for the opposing status, since we received this status
-        redis.delete(build_active_consecutive_status_key(project_subscription, delete_status))
+        pipeline.delete(build_active_consecutive_status_key(project_subscription, delete_status))
 
         if uptime_status == UptimeStatus.OK and result_status == CHECKSTATUS_FAILURE:
-            if not has_reached_status_threshold(project_subscription, result_status, metric_tags):
+            if not has_reached_status_threshold(
+                project_subscription, result_status, metric_tags, pipeline
+            ):
                 return
 
             issue_creation_flag_enabled = features.has(
@@ -540,16 +617,11 @@ class UptimeResultProcessor(ResultProcessor[CheckResult, UptimeSubscription]):
                         **result,
                     },
                 )
-            # TODO(epurkhiser): Dual until we're only reading the uptime_status
-            # from the uptime_subscription.
-            project_subscription.update(
-                uptime_status=UptimeStatus.FAILED, uptime_status_update_date=django_timezone.now()
-            )
-            project_subscription.uptime_subscription.update(
-                uptime_status=UptimeStatus.FAILED, uptime_status_update_date=django_timezone.now()
-            )
+            update_uptime_status(project_subscription, UptimeStatus.FAILED)
         elif uptime_status == UptimeStatus.FAILED and result_status == CHECKSTATUS_SUCCESS:
-            if not has_reached_status_threshold(project_subscription, result_status, metric_tags):
+            if not has_reached_status_threshold(
+                project_subscription, result_status, metric_tags, pipeline
+            ):
                 return
 
             if features.has(
@@ -569,14 +641,7 @@ class UptimeResultProcessor(ResultProcessor[CheckResult, UptimeSubscription]):
                         **result,
                     },
                 )
-            # TODO(epurkhiser): Dual until we're only reading the uptime_status
-            # from the uptime_subscription.
-            project_subscription.update(
-                uptime_status=UptimeStatus.OK, uptime_status_update_date=django_timezone.now()
-            )
-            project_subscription.uptime_subscription.update(
-                uptime_status=UptimeStatus.OK, uptime_status_update_date=django_timezone.now()
-            )
+            update_uptime_status(project_subscription, UptimeStatus.OK)
 
 
 class UptimeResultsStrategyFactory(ResultsStrategyFactory[CheckResult, UptimeSubscription]):
@@ -799,7 +799,9 @@ def get_data_source(alert_rule: AlertRule) -> DataSource | None:
 
 def dual_delete_migrated_alert_rule(alert_rule: AlertRule) -> None:
     try:
-        alert_rule_detector = AlertRuleDetector.objects.get(alert_rule_id=alert_rule.id)
+        alert_rule_detector = AlertRuleDetector.objects.select_related(
+            "detector__workflow_condition_group"
+        ).get(alert_rule_id=alert_rule.id)
     except AlertRuleDetector.DoesNotExist:
         # NOTE: we run the dual delete even if the user isn't flagged into dual write
         logger.info(
@@ -807,7 +809,9 @@ def dual_delete_migrated_alert_rule(alert_rule: AlertRule) -> None:
             extra={"alert_rule_id": alert_rule.id},
         )
         return
-    alert_rule_workflow = AlertRuleWorkflow.objects.get(alert_rule_id=alert_rule.id)
+    alert_rule_workflow = AlertRuleWorkflow.objects.select_related("workflow").get(
+        alert_rule_id=alert_rule.id
+    )
 
     workflow: Workflow = alert_rule_workflow.workflow
     detector: Detector = alert_rule_detector.detector
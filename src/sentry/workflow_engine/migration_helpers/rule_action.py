@@ -1,12 +1,82 @@
 import logging
 from typing import Any
 
-from sentry.workflow_engine.models.action import Action
+from sentry.workflow_engine.models.action import Action, enforce_config_schema
 from sentry.workflow_engine.typings.notification_action import issue_alert_action_translator_mapping
 
 logger = logging.getLogger(__name__)
 
 
+def _translate_rule_data_action(action: dict[str, Any], skip_failures: bool) -> Action | None:
+    """
+    Translates a single action from Rule.data.actions into an unsaved Action.
+    Returns None for an invalid action when skip_failures is set, otherwise raises.
+    """
+    # Fetch the registry ID
+    registry_id = action.get("id")
+    action_uuid = action.get("uuid")
+    if not registry_id:
+        logger.error(
+            "No registry ID found for action",
+            extra={"action_uuid": action_uuid},
+        )
+        if skip_failures:
+            return None
+        raise ValueError(f"No registry ID found for action: {action}")
+
+    # Fetch the translator class
+    translator_class = issue_alert_action_translator_mapping.get(registry_id)
+    if translator_class is None:
+        logger.error(
+            "Action translator not found for action",
+            extra={
+                "registry_id": registry_id,
+                "action_uuid": action_uuid,
+            },
+        )
+        if skip_failures:
+            return None
+        raise ValueError(
+            f"Action translator not found for action with registry ID: {registry_id}, uuid: {action_uuid}"
+        )
+    translator = translator_class(action)
+
+    # Check if the action is well-formed
+    if not translator.is_valid():
+        logger.error(
+            "Action blob is malformed: missing required fields",
+            extra={
+                "registry_id": registry_id,
+                "action_uuid": action_uuid,
+                "missing_fields": translator.missing_fields,
+            },
+        )
+        if skip_failures:
+            return None
+        raise ValueError(
+            f"Action blob is malformed: missing required fields with registry ID: {registry_id}, uuid: {action_uuid}"
+        )
+
+    try:
+        return Action(
+            type=translator.action_type,
+            data=translator.get_sanitized_data(),
+            integration_id=translator.integration_id,
+            config=translator.action_config,
+        )
+    except Exception:
+        if not skip_failures:
+            raise
+        logger.exception(
+            "Failed to translate action",
+            extra={
+                "registry_id": registry_id,
+                "action_uuid": action_uuid,
+            },
+        )
+        return None
+
+
 def translate_rule_data_actions_to_notification_actions(
     actions: list[dict[str, Any]], skip_failures: bool
 ) -> list[Action]:
@@ -18,73 +88,11 @@ def translate_rule_data_actions_to_notification_actions(
     :param skip_failures: if True, invalid actions will be skipped instead of raising exceptions
     :return: list of notification actions (Action)
     """
-
-    notification_actions: list[Action] = []
-
-    for action in actions:
-        # Fetch the registry ID
-        registry_id = action.get("id")
-        if not registry_id:
-            logger.error(
-                "No registry ID found for action",
-                extra={"action_uuid": action.get("uuid")},
-            )
-            if skip_failures:
-                continue
-            raise ValueError(f"No registry ID found for action: {action}")
-
-        # Fetch the translator class
-        try:
-            translator_class = issue_alert_action_translator_mapping[registry_id]
-            translator = translator_class(action)
-        except KeyError as e:
-            logger.exception(
-                "Action translator not found for action",
-                extra={
-                    "registry_id": registry_id,
-                    "action_uuid": action.get("uuid"),
-                },
-            )
-            if skip_failures:
-                continue
-            raise ValueError(
-                f"Action translator not found for action with registry ID: {registry_id}, uuid: {action.get('uuid')}"
-            ) from e
-
-        # Check if the action is well-formed
-        if not translator.is_valid():
-            logger.error(
-                "Action blob is malformed: missing required fields",
-                extra={
-                    "registry_id": registry_id,
-                    "action_uuid": action.get("uuid"),
-                    "missing_fields": translator.missing_fields,
-                },
-            )
-            if skip_failures:
-                continue
-            raise ValueError(
-                f"Action blob is malformed: missing required fields with registry ID: {registry_id}, uuid: {action.get('uuid')}"
-            )
-
-        try:
-            notification_action = Action(
-                type=translator.action_type,
-                data=translator.get_sanitized_data(),
-                integration_id=translator.integration_id,
-                config=translator.action_config,
-            )
-
-            notification_actions.append(notification_action)
-        except Exception as e:
-            if not skip_failures:
-                raise
-            logger.exception(
-                "Failed to translate action",
-                extra={"action": action, "error": str(e)},
-            )
-
-    return notification_actions
+    return [
+        notification_action
+        for action in actions
+        if (notification_action := _translate_rule_data_action(action, skip_failures)) is not None
+    ]
 
 
 def build_notification_actions_from_rule_data_actions(
@@ -103,12 +111,17 @@ def build_notification_actions_from_rule_data_actions(
     :return: list of notification actions (Action)
     """
 
+    if not actions:
+        return []
+
     notification_actions = translate_rule_data_actions_to_notification_actions(
         actions, skip_failures=not is_dry_run
     )
 
     # Create the actions if not a dry run
     if not is_dry_run:
+        # bulk_create does not send pre_save, so validate the configs ourselves
         for action in notification_actions:
-            action.save()
+            enforce_config_schema(sender=Action, instance=action)
+        notification_actions = Action.objects.bulk_create(notification_actions)
     return notification_actions
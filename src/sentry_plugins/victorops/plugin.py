@@ -64,49 +64,53 @@ class VictorOpsPlugin(CorePluginMixin, NotificationPlugin):
             },
         ]
 
-    def get_client(self, project):
-        return VictorOpsClient(
-            api_key=self.get_option("api_key", project),
-            routing_key=self.get_option("routing_key", project),
-        )
+    def get_client(self, project, api_key=None, routing_key=None):
+        if api_key is None:
+            api_key = self.get_option("api_key", project)
+        if routing_key is None:
+            routing_key = self.get_option("routing_key", project)
+        return VictorOpsClient(api_key=api_key, routing_key=routing_key)
 
     def build_description(self, event):
         enhanced_privacy = event.organization.flags.enhanced_privacy
         if enhanced_privacy:
             return ENHANCED_PRIVACY_BODY
 
-        interface_list = []
-        for interface in event.interfaces.values():
-            body = interface.to_string(event)
-            if not body:
-                continue
-            interface_list.append((interface.get_title(), body))
-
-        return "\n\n".join((f"{k}\n-----------\n\n{v}" for k, v in interface_list))
+        return "\n\n".join(
+            [
+                f"{interface.get_title()}\n-----------\n\n{body}"
+                for interface in event.interfaces.values()
+                if (body := interface.to_string(event))
+            ]
+        )
 
     def notify_users(self, group, event, triggering_rules) -> None:
-        if not self.is_configured(group.project):
+        project = group.project
+        # Read the key once and hand it to get_client rather than going through is_configured
+        api_key = self.get_option("api_key", project)
+        if not api_key:
             return
 
         level = event.get_tag("level")
         if level in ("info", "debug"):
             message_type = "INFO"
-        if level == "warning":
+        elif level == "warning":
             message_type = "WARNING"
         else:
             message_type = "CRITICAL"
 
-        client = self.get_client(group.project)
+        state_message = self.build_description(event)
+        client = self.get_client(project, api_key=api_key)
         try:
             response = client.trigger_incident(
                 message_type=message_type,
                 entity_id=group.id,
                 entity_display_name=event.title,
-                state_message=self.build_description(event),
-                timestamp=int(event.datetime.strftime("%s")),
+                state_message=state_message,
+                timestamp=int(event.datetime.timestamp()),
                 issue_url=group.get_absolute_url(),
                 issue_id=group.id,
-                project_id=group.project.id,
+                project_id=project.id,
             )
         except ApiError as e:
             self.raise_error(e)
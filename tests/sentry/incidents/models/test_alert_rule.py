@@ -28,9 +28,76 @@ class IncidentGetForSubscriptionTest(TestCase):
         assert AlertRule.objects.get_for_subscription(subscription) == alert_rule
 
         # Now test fetching from cache
-        assert cache.get(AlertRule.objects.CACHE_SUBSCRIPTION_KEY % subscription.id) == alert_rule
+        assert (
+            cache.get(AlertRule.objects.CACHE_SUBSCRIPTION_KEY % subscription.id)["id"]
+            == alert_rule.id
+        )
         assert AlertRule.objects.get_for_subscription(subscription) == alert_rule
 
+    def test_cached_fields(self):
+        alert_rule = self.create_alert_rule()
+        subscription = alert_rule.snuba_query.subscriptions.get()
+        from_db = AlertRule.objects.get_for_subscription(subscription)
+
+        with self.assertNumQueries(0):
+            from_cache = AlertRule.objects.get_for_subscription(subscription)
+            assert from_cache.name == from_db.name
+            assert from_cache.threshold_type == from_db.threshold_type
+            assert from_cache.snuba_query_id == from_db.snuba_query_id
+            assert from_cache._state.adding is False
+
+    def test_cached_payload_extra_key(self):
+        alert_rule = self.create_alert_rule()
+        subscription = alert_rule.snuba_query.subscriptions.get()
+        cache_key = AlertRule.objects.CACHE_SUBSCRIPTION_KEY % subscription.id
+        AlertRule.objects.get_for_subscription(subscription)
+        # Simulate a payload cached before a column was removed
+        cache.set(cache_key, {"removed_column": 1, **cache.get(cache_key)}, 3600)
+
+        from_cache = AlertRule.objects.get_for_subscription(subscription)
+        assert from_cache.id == alert_rule.id
+        assert from_cache.name == alert_rule.name
+        assert from_cache.threshold_type == alert_rule.threshold_type
+        assert from_cache.snuba_query_id == alert_rule.snuba_query_id
+
+    def test_cached_payload_missing_key(self):
+        alert_rule = self.create_alert_rule()
+        subscription = alert_rule.snuba_query.subscriptions.get()
+        cache_key = AlertRule.objects.CACHE_SUBSCRIPTION_KEY % subscription.id
+        AlertRule.objects.get_for_subscription(subscription)
+        # Simulate a payload cached before a column was added
+        payload = cache.get(cache_key)
+        del payload["name"]
+        cache.set(cache_key, payload, 3600)
+
+        from_cache = AlertRule.objects.get_for_subscription(subscription)
+        assert from_cache.threshold_type == alert_rule.threshold_type
+        assert from_cache.snuba_query_id == alert_rule.snuba_query_id
+        # The missing column is deferred and loaded on access
+        assert from_cache.name == alert_rule.name
+
+    def test_many(self):
+        alert_rule = self.create_alert_rule()
+        subscription = alert_rule.snuba_query.subscriptions.get()
+        other_alert_rule = self.create_alert_rule()
+        other_subscription = other_alert_rule.snuba_query.subscriptions.get()
+
+        # Prime the cache for one subscription so the batch mixes hits and misses
+        AlertRule.objects.get_for_subscription(subscription)
+        assert cache.get(AlertRule.objects.CACHE_SUBSCRIPTION_KEY % other_subscription.id) is None
+
+        assert AlertRule.objects.get_for_subscriptions([subscription, other_subscription]) == {
+            subscription.id: alert_rule,
+            other_subscription.id: other_alert_rule,
+        }
+        assert (
+            cache.get(AlertRule.objects.CACHE_SUBSCRIPTION_KEY % other_subscription.id)["id"]
+            == other_alert_rule.id
+        )
+
+    def test_many_empty(self):
+        assert AlertRule.objects.get_for_subscriptions([]) == {}
+
 
 class IncidentClearSubscriptionCacheTest(TestCase):
     def setUp(self):
@@ -40,8 +107,8 @@ class IncidentClearSubscriptionCacheTest(TestCase):
     def test_updated_subscription(self):
         AlertRule.objects.get_for_subscription(self.subscription)
         assert (
-            cache.get(AlertRule.objects.CACHE_SUBSCRIPTION_KEY % self.subscription.id)
-            == self.alert_rule
+            cache.get(AlertRule.objects.CACHE_SUBSCRIPTION_KEY % self.subscription.id)["id"]
+            == self.alert_rule.id
         )
         self.subscription.save()
         assert cache.get(AlertRule.objects.CACHE_SUBSCRIPTION_KEY % self.subscription.id) is None
@@ -49,8 +116,8 @@ class IncidentClearSubscriptionCacheTest(TestCase):
     def test_deleted_subscription(self):
         AlertRule.objects.get_for_subscription(self.subscription)
         assert (
-            cache.get(AlertRule.objects.CACHE_SUBSCRIPTION_KEY % self.subscription.id)
-            == self.alert_rule
+            cache.get(AlertRule.objects.CACHE_SUBSCRIPTION_KEY % self.subscription.id)["id"]
+            == self.alert_rule.id
         )
         subscription_id = self.subscription.id
         self.subscription.delete()
@@ -64,8 +131,8 @@ class IncidentClearSubscriptionCacheTest(TestCase):
     def test_deleted_alert_rule(self):
         AlertRule.objects.get_for_subscription(self.subscription)
         assert (
-            cache.get(AlertRule.objects.CACHE_SUBSCRIPTION_KEY % self.subscription.id)
-            == self.alert_rule
+            cache.get(AlertRule.objects.CACHE_SUBSCRIPTION_KEY % self.subscription.id)["id"]
+            == self.alert_rule.id
         )
         delete_alert_rule(self.alert_rule)
         assert cache.get(AlertRule.objects.CACHE_SUBSCRIPTION_KEY % self.subscription.id) is None
@@ -80,9 +147,12 @@ class AlertRuleTriggerClearCacheTest(TestCase):
 
     def test_updated_alert_rule(self):
         AlertRuleTrigger.objects.get_for_alert_rule(self.alert_rule)
-        assert cache.get(AlertRuleTrigger.objects._build_trigger_cache_key(self.alert_rule.id)) == [
-            self.trigger
-        ]
+        assert [
+            trigger["id"]
+            for trigger in cache.get(
+                AlertRuleTrigger.objects._build_trigger_cache_key(self.alert_rule.id)
+            )
+        ] == [self.trigger.id]
         self.alert_rule.save()
         assert (
             cache.get(AlertRuleTrigger.objects._build_trigger_cache_key(self.alert_rule.id))
@@ -90,18 +160,24 @@ class AlertRuleTriggerClearCacheTest(TestCase):
 
     def test_deleted_alert_rule(self):
         AlertRuleTrigger.objects.get_for_alert_rule(self.alert_rule)
-        assert cache.get(AlertRuleTrigger.objects._build_trigger_cache_key(self.alert_rule.id)) == [
-            self.trigger
-        ]
+        assert [
+            trigger["id"]
+            for trigger in cache.get(
+                AlertRuleTrigger.objects._build_trigger_cache_key(self.alert_rule.id)
+            )
+        ] == [self.trigger.id]
         alert_rule_id = self.alert_rule.id
         self.alert_rule.delete()
         assert (cache.get(AlertRuleTrigger.objects._build_trigger_cache_key(alert_rule_id))) is None
 
     def test_updated_alert_rule_trigger(self):
         AlertRuleTrigger.objects.get_for_alert_rule(self.alert_rule)
-        assert cache.get(AlertRuleTrigger.objects._build_trigger_cache_key(self.alert_rule.id)) == [
-            self.trigger
-        ]
+        assert [
+            trigger["id"]
+            for trigger in cache.get(
+                AlertRuleTrigger.objects._build_trigger_cache_key(self.alert_rule.id)
+            )
+        ] == [self.trigger.id]
         self.trigger.save()
         assert (
             cache.get(AlertRuleTrigger.objects._build_trigger_cache_key(self.alert_rule.id))
@@ -109,15 +185,59 @@ class AlertRuleTriggerClearCacheTest(TestCase):
 
     def test_deleted_alert_rule_trigger(self):
         AlertRuleTrigger.objects.get_for_alert_rule(self.alert_rule)
-        assert cache.get(AlertRuleTrigger.objects._build_trigger_cache_key(self.alert_rule.id)) == [
-            self.trigger
-        ]
+        assert [
+            trigger["id"]
+            for trigger in cache.get(
+                AlertRuleTrigger.objects._build_trigger_cache_key(self.alert_rule.id)
+            )
+        ] == [self.trigger.id]
         self.trigger.delete()
         assert (
             cache.get(AlertRuleTrigger.objects._build_trigger_cache_key(self.alert_rule.id))
         ) is None
 
 
+class AlertRuleTriggerGetForAlertRulesTest(TestCase):
+    def test(self):
+        alert_rule = self.create_alert_rule()
+        trigger = self.create_alert_rule_trigger(alert_rule)
+        other_alert_rule = self.create_alert_rule()
+        other_trigger = self.create_alert_rule_trigger(other_alert_rule)
+        empty_alert_rule = self.create_alert_rule()
+
+        # Prime the cache for one rule so the batch mixes hits and misses
+        AlertRuleTrigger.objects.get_for_alert_rule(alert_rule)
+
+        assert AlertRuleTrigger.objects.get_for_alert_rules(
+            [alert_rule, other_alert_rule, empty_alert_rule]
+        ) == {
+            alert_rule.id: [trigger],
+            other_alert_rule.id: [other_trigger],
+            empty_alert_rule.id: [],
+        }
+        assert (
+            cache.get(AlertRuleTrigger.objects._build_trigger_cache_key(empty_alert_rule.id)) == []
+        )
+
+    def test_cached_fields(self):
+        alert_rule = self.create_alert_rule()
+        trigger = self.create_alert_rule_trigger(alert_rule)
+        cache_key = AlertRuleTrigger.objects._build_trigger_cache_key(alert_rule.id)
+        (from_db,) = AlertRuleTrigger.objects.get_for_alert_rules([alert_rule])[alert_rule.id]
+        # Simulate a payload cached before a column was removed
+        cache.set(cache_key, [{"removed_column": 1, **cache.get(cache_key)[0]}], 3600)
+
+        with self.assertNumQueries(0):
+            (from_cache,) = AlertRuleTrigger.objects.get_for_alert_rules([alert_rule])[
+                alert_rule.id
+            ]
+            assert from_cache.id == trigger.id
+            assert from_cache.label == from_db.label
+            assert from_cache.alert_threshold == from_db.alert_threshold
+            assert from_cache.alert_rule_id == from_db.alert_rule_id
+            assert from_cache._state.adding is False
+
+
 class IncidentAlertRuleRelationTest(TestCase):
     def test(self):
         self.alert_rule = self.create_alert_rule()
@@ -313,6 +313,23 @@ class TestBaseMetricAlertHandler(MetricAlertHandlerBase):
         query = MetricIssueContext._get_snuba_query(group_event.occurrence)
         assert query == self.snuba_query
 
+    def test_get_snuba_query_after_update(self):
+        _, _, group_event = self.create_group_event(
+            group_type_id=MetricIssue.type_id,
+            occurrence=self.create_issue_occurrence(
+                priority=PriorityLevel.HIGH.value,
+                level="error",
+                evidence_data={"snuba_query_id": self.snuba_query.id},
+            ),
+        )
+        assert group_event.occurrence is not None
+        MetricIssueContext._get_snuba_query(group_event.occurrence)
+
+        SnubaQuery.objects.filter(id=self.snuba_query.id).update(query="level:error")
+
+        query = MetricIssueContext._get_snuba_query(group_event.occurrence)
+        assert query.query == "level:error"
+
     def test_get_new_status(self):
         assert self.group_event.occurrence is not None
         status = MetricIssueContext._get_new_status(
@@ -0,0 +1,64 @@
+from io import SEEK_CUR, SEEK_END, BufferedReader
+
+import pytest
+
+from sentry.relocation.services.relocation_export.impl import _EncryptedBytesReader
+
+DATA = list(b"encrypted payload")
+
+
+def test_read_chunks() -> None:
+    reader = _EncryptedBytesReader(DATA)
+    assert reader.read(9) == b"encrypted"
+    assert reader.tell() == 9
+    assert reader.read(1) == b" "
+    assert reader.read(7) == b"payload"
+    assert reader.tell() == len(DATA)
+
+
+def test_read_all() -> None:
+    reader = _EncryptedBytesReader(DATA)
+    assert reader.read(-1) == bytes(DATA)
+    assert reader.read(-1) == b""
+
+    reader.seek(10)
+    assert reader.readall() == b"payload"
+
+
+def test_read_past_eof() -> None:
+    reader = _EncryptedBytesReader(DATA)
+    reader.seek(10)
+    assert reader.read(100) == b"payload"
+    assert reader.read(1) == b""
+
+    reader.seek(len(DATA) + 5)
+    assert reader.read(1) == b""
+    assert reader.tell() == len(DATA) + 5
+
+
+def test_seek_and_tell() -> None:
+    reader = _EncryptedBytesReader(DATA)
+    assert reader.seek(0, SEEK_END) == len(DATA)
+    assert reader.tell() == len(DATA)
+
+    assert reader.seek(-7, SEEK_END) == 10
+    assert reader.read() == b"payload"
+
+    reader.seek(0)
+    assert reader.seek(3, SEEK_CUR) == 3
+    assert reader.read(6) == b"rypted"
+
+
+def test_seek_invalid() -> None:
+    reader = _EncryptedBytesReader(DATA)
+    with pytest.raises(ValueError):
+        reader.seek(-1)
+    with pytest.raises(ValueError):
+        reader.seek(0, 3)
+    assert reader.tell() == 0
+
+
+def test_buffered() -> None:
+    reader = BufferedReader(_EncryptedBytesReader(DATA), buffer_size=4)
+    assert reader.read(9) == b"encrypted"
+    assert reader.read() == b" payload"
@@ -47,3 +47,12 @@ class UpdateCodeOwnersSchemaTest(TestCase):
         with self.feature("organizations:integrations-codeowners"):
             update_code_owners_schema(self.organization.id, integration=self.integration.id)
         self.mock_update.assert_called_with(organization=self.organization)
+
+    def test_with_project_and_unrelated_integration(self):
+        with self.feature("organizations:integrations-codeowners"):
+            update_code_owners_schema(
+                self.organization.id,
+                integration=self.integration.id + 1,
+                projects=[self.project.id],
+            )
+        self.mock_update.assert_called_with(organization=self.organization)
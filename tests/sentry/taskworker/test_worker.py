@@ -137,12 +137,12 @@ class TestTaskWorker(TestCase):
 
             taskworker.start_result_thread()
             taskworker.start_spawn_children_thread()
-            start = time.time()
+            deadline = time.monotonic() + max_runtime
             while True:
                 taskworker.run_once()
                 if mock_client.update_task.called:
                     break
-                if time.time() - start > max_runtime:
+                if time.monotonic() > deadline:
                     taskworker.shutdown()
                     raise AssertionError("Timeout waiting for update_task to be called")
 
@@ -172,12 +172,12 @@ class TestTaskWorker(TestCase):
             taskworker.start_spawn_children_thread()
 
             # Run until two tasks have been processed
-            start = time.time()
+            deadline = time.monotonic() + max_runtime
             while True:
                 taskworker.run_once()
                 if mock_client.update_task.call_count >= 2:
                     break
-                if time.time() - start > max_runtime:
+                if time.monotonic() > deadline:
                     taskworker.shutdown()
                     raise AssertionError("Timeout waiting for get_task to be called")
 
@@ -218,12 +218,12 @@ class TestTaskWorker(TestCase):
             taskworker.start_spawn_children_thread()
 
             # Run until the update has 'completed'
-            start = time.time()
+            deadline = time.monotonic() + max_runtime
             while True:
                 taskworker.run_once()
                 if mock_client.update_task.call_count >= 3:
                     break
-                if time.time() - start > max_runtime:
+                if time.monotonic() > deadline:
                     taskworker.shutdown()
                     raise AssertionError("Timeout waiting for get_task to be called")
 
@@ -249,12 +249,12 @@ class TestTaskWorker(TestCase):
             taskworker.start_spawn_children_thread()
 
             # Run until two tasks have been processed
-            start = time.time()
+            deadline = time.monotonic() + max_runtime
             while True:
                 taskworker.run_once()
                 if mock_client.update_task.call_count >= 1:
                     break
-                if time.time() - start > max_runtime:
+                if time.monotonic() > deadline:
                     taskworker.shutdown()
                     raise AssertionError("Timeout waiting for get_task to be called")
 
@@ -273,7 +273,6 @@ class TestTaskWorker(TestCase):
             redis.delete("no-retries-remaining")
 
 
-@pytest.mark.django_db
 @mock.patch("sentry.taskworker.workerchild.capture_checkin")
 def test_child_process_complete(mock_capture_checkin) -> None:
     todo: queue.Queue[TaskActivation] = queue.Queue()
@@ -297,7 +296,6 @@ def test_child_process_complete(mock_capture_checkin) -> None:
     assert mock_capture_checkin.call_count == 0
 
 
-@pytest.mark.django_db
 def test_child_process_retry_task() -> None:
     todo: queue.Queue[TaskActivation] = queue.Queue()
     processed: queue.Queue[ProcessingResult] = queue.Queue()
@@ -319,7 +317,6 @@ def test_child_process_retry_task() -> None:
     assert result.status == TASK_ACTIVATION_STATUS_RETRY
 
 
-@pytest.mark.django_db
 def test_child_process_failure_task() -> None:
     todo: queue.Queue[TaskActivation] = queue.Queue()
     processed: queue.Queue[ProcessingResult] = queue.Queue()
@@ -341,7 +338,6 @@ def test_child_process_failure_task() -> None:
     assert result.status == TASK_ACTIVATION_STATUS_FAILURE
 
 
-@pytest.mark.django_db
 def test_child_process_shutdown() -> None:
     todo: queue.Queue[TaskActivation] = queue.Queue()
     processed: queue.Queue[ProcessingResult] = queue.Queue()
@@ -363,7 +359,6 @@ def test_child_process_shutdown() -> None:
     assert processed.qsize() == 0
 
 
-@pytest.mark.django_db
 def test_child_process_unknown_task() -> None:
     todo: queue.Queue[TaskActivation] = queue.Queue()
     processed: queue.Queue[ProcessingResult] = queue.Queue()
@@ -389,7 +384,6 @@ def test_child_process_unknown_task() -> None:
     assert result.status == TASK_ACTIVATION_STATUS_COMPLETE
 
 
-@pytest.mark.django_db
 def test_child_process_at_most_once() -> None:
     todo: queue.Queue[TaskActivation] = queue.Queue()
     processed: queue.Queue[ProcessingResult] = queue.Queue()
@@ -417,7 +411,6 @@ def test_child_process_at_most_once() -> None:
     assert result.status == TASK_ACTIVATION_STATUS_COMPLETE
 
 
-@pytest.mark.django_db
 @mock.patch("sentry.taskworker.workerchild.capture_checkin")
 def test_child_process_record_checkin(mock_capture_checkin: mock.Mock) -> None:
     todo: queue.Queue[TaskActivation] = queue.Queue()
@@ -448,7 +441,6 @@ def test_child_process_record_checkin(mock_capture_checkin: mock.Mock) -> None:
     )
 
 
-@pytest.mark.django_db
 @mock.patch("sentry.taskworker.workerchild.sentry_sdk.capture_exception")
 def test_child_process_terminate_task(mock_capture: mock.Mock) -> None:
     todo: queue.Queue[TaskActivation] = queue.Queue()
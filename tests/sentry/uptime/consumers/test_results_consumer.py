@@ -29,10 +29,13 @@ from sentry.testutils.helpers.datetime import freeze_time
 from sentry.testutils.helpers.options import override_options
 from sentry.uptime.consumers.results_consumer import (
     AUTO_DETECTED_ACTIVE_SUBSCRIPTION_INTERVAL,
+    ONBOARDING_FAILURE_REDIS_TTL,
     ONBOARDING_MONITOR_PERIOD,
     UptimeResultsStrategyFactory,
     build_last_update_key,
     build_onboarding_failure_key,
+    memoized_event_retention,
+    memoized_top_hosting_provider_names,
 )
 from sentry.uptime.detectors.ranking import _get_cluster
 from sentry.uptime.detectors.tasks import is_failed_url
@@ -58,6 +61,8 @@ class ProcessResultTest(ConfigPusherTestMixin, metaclass=abc.ABCMeta):
 
     def setUp(self):
         super().setUp()
+        memoized_top_hosting_provider_names.cache_clear()
+        memoized_event_retention.cache_clear()
         self.partition = Partition(Topic("test"), 0)
         self.subscription = self.create_uptime_subscription(
             subscription_id=uuid.uuid4().hex, interval_seconds=300, region_slugs=["default"]
@@ -691,6 +696,36 @@ class ProcessResultTest(ConfigPusherTestMixin, metaclass=abc.ABCMeta):
         with pytest.raises(ProjectUptimeSubscription.DoesNotExist):
             self.project_subscription.refresh_from_db()
 
+    def test_onboarding_failure_keeps_window(self):
+        self.project_subscription.update(
+            mode=ProjectUptimeSubscriptionMode.AUTO_DETECTED_ONBOARDING
+        )
+        redis = _get_cluster()
+        key = build_onboarding_failure_key(self.project_subscription)
+        with self.feature(["organizations:uptime", "organizations:uptime-create-issues"]):
+            self.send_result(
+                self.create_uptime_result(
+                    self.subscription.subscription_id,
+                    status=CHECKSTATUS_FAILURE,
+                    scheduled_check_time=datetime.now() - timedelta(minutes=5),
+                )
+            )
+            assert redis.get(key) == "1"
+            ttl = redis.ttl(key)
+            assert 0 < ttl <= ONBOARDING_FAILURE_REDIS_TTL.total_seconds()
+
+            # Shorten the window so that a reset by the next failure would be visible
+            redis.expire(key, 60)
+            self.send_result(
+                self.create_uptime_result(
+                    self.subscription.subscription_id,
+                    status=CHECKSTATUS_FAILURE,
+                    scheduled_check_time=datetime.now() - timedelta(minutes=4),
+                )
+            )
+        assert redis.get(key) == "2"
+        assert 0 < redis.ttl(key) <= 60
+
     def test_onboarding_success_ongoing(self):
         self.project_subscription.update(
             mode=ProjectUptimeSubscriptionMode.AUTO_DETECTED_ONBOARDING,
@@ -1,5 +1,6 @@
 from unittest import mock
 
+import orjson
 from arroyo.backends.kafka.consumer import KafkaPayload
 from arroyo.backends.local.backend import LocalBroker
 from arroyo.backends.local.storages.memory import MemoryMessageStorage
@@ -10,7 +11,6 @@ from sentry.testutils.helpers.options import override_options
 from sentry.testutils.helpers.usage_accountant import usage_accountant_backend
 from sentry.testutils.pytest.fixtures import django_db_all
 from sentry.usage_accountant import record
-from sentry.utils.json import loads
 
 
 def assert_msg(
@@ -24,7 +24,7 @@ def assert_msg(
     assert message is not None
     payload = message.payload
     assert payload is not None
-    formatted = loads(payload.value.decode("utf-8"))
+    formatted = orjson.loads(payload.value)
     assert formatted == {
         "timestamp": timestamp,
         "shared_resource_id": resource_id,
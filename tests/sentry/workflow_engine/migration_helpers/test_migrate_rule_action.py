@@ -236,7 +236,7 @@ class TestNotificationActionMigrationUtils(TestCase):
             extra={"action_uuid": "b1234567-89ab-cdef-0123-456789abcdef"},
         )
 
-    @patch("sentry.workflow_engine.migration_helpers.rule_action.logger.exception")
+    @patch("sentry.workflow_engine.migration_helpers.rule_action.logger.error")
     def test_unregistered_action_translator(self, mock_logger):
         action_data = [
             {
@@ -88,12 +88,34 @@ class VictorOpsPluginTest(PluginTestCase):
             "entity_display_name": "Hello world",
             "monitoring_tool": "sentry",
             "state_message": 'Stacktrace\n-----------\n\nStacktrace (most recent call last):\n\n  File "sentry/models/foo.py", line 29, in build_msg\n    string_max_length=self.string_max_length)\n\nMessage\n-----------\n\nHello world',
-            "timestamp": int(event.datetime.strftime("%s")),
+            "timestamp": int(event.datetime.timestamp()),
             "issue_url": group.get_absolute_url(),
             "issue_id": group.id,
             "project_id": group.project.id,
         } == payload
 
+    @responses.activate
+    def test_info_notification(self):
+        responses.add(
+            "POST",
+            "https://alert.victorops.com/integrations/generic/20131114/alert/secret-api-key/everyone",
+            body=SUCCESS,
+        )
+        self.plugin.set_option("api_key", "secret-api-key", self.project)
+        self.plugin.set_option("routing_key", "everyone", self.project)
+
+        event = self.store_event(
+            data={"message": "Hello world", "level": "info"},
+            project_id=self.project.id,
+        )
+        assert event.group is not None
+
+        rule = Rule.objects.create(project=self.project, label="my rule")
+        self.plugin.notify(Notification(event=event, rule=rule))
+
+        payload = orjson.loads(responses.calls[0].request.body)
+        assert payload["message_type"] == "INFO"
+
     def test_build_description_unicode(self):
         event = self.store_event(
             data={"message": "abcd\xde\xb4", "culprit": "foo.bar", "level": "error"},